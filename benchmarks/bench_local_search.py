@@ -0,0 +1,76 @@
+"""
+Compare the local search variants against A* on the seeded benchmark maps.
+
+For every map kind and size, each solver runs on a number of seeds. Success rate
+is measured over the instances that A* proves solvable; time is the mean over all runs.
+
+Usage:
+    python -m benchmarks.bench_local_search --size 30 --seeds 20
+"""
+import argparse
+import time
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
+from src.algorithms import astar, hill_climbing, simulated_annealing, beam_search
+from src.algorithms.local_search import parallel_restarts
+from src.problems.grid_problem import GridProblem
+from src.problems.maps import MAPS
+
+
+def solvers(budget, executor):
+    return [
+        ("A*", astar.search),
+        ("Hill Climbing", hill_climbing.search),
+        ("HC + Sideways(3)", partial(hill_climbing.search, sideways=3, restarts=50, seed=1, max_steps=budget)),
+        ("HC + Random Restart", partial(hill_climbing.search, restarts=50, seed=1, max_steps=budget)),
+        ("Beam Search (k=10)", partial(beam_search.search, beam_width=10, max_steps=budget)),
+        ("Simulated Annealing", partial(simulated_annealing.search, seed=1, max_steps=budget)),
+        ("SA x8 (parallel)", partial(parallel_restarts, simulated_annealing.search, attempts=8, mode="first",
+                                     executor=executor, max_steps=budget)),
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--size", type=int, nargs="+", default=[20, 40])
+    parser.add_argument("--seeds", type=int, default=20)
+    parser.add_argument("--budget", type=int, default=20000, help="max steps per local search run")
+    args = parser.parse_args()
+
+    # One shared pool, so the parallel runs do not pay process start-up every call
+    executor = ProcessPoolExecutor()
+
+    print(f"{'Map':<14} {'Algorithm':<22} {'Success':>9} {'Mean Time(ms)':>14} {'Mean Cost':>10}")
+    for size in args.size:
+        for kind, make_map in MAPS.items():
+            problems = []
+            for seed in range(args.seeds):
+                grid, start, goal = make_map(size, size, seed)
+                problems.append(GridProblem(start, goal, grid, size, size))
+
+            solvable = [astar.search(p)[0] is not None for p in problems]
+            if not any(solvable):
+                continue
+
+            for name, search_fn in solvers(args.budget, executor):
+                found, total_time, total_cost = 0, 0.0, 0
+                for problem, ok in zip(problems, solvable):
+                    t0 = time.perf_counter()
+                    path, nodes = search_fn(problem)
+                    total_time += time.perf_counter() - t0
+                    if path is not None and ok:
+                        found += 1
+                        total_cost += len(path) - 1
+
+                rate = f"{found}/{sum(solvable)}"
+                mean_cost = f"{total_cost / found:.1f}" if found else "-"
+                print(f"{kind + f' {size}x{size}':<14} {name:<22} {rate:>9} "
+                      f"{total_time / len(problems) * 1000:>14.2f} {mean_cost:>10}")
+            print()
+
+    executor.shutdown()
+
+
+if __name__ == "__main__":
+    main()
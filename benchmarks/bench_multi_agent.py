@@ -0,0 +1,61 @@
+"""
+Throughput of cooperative multi-agent planning, in agents planned per second.
+
+Agents get distinct random start and goal cells on a seeded random map.
+For comparison, the 'A* (independent)' row plans every agent alone and
+counts the collisions that cooperative planning avoids.
+
+Usage:
+    python -m benchmarks.bench_multi_agent --size 64 --agents 50 100 200 400
+"""
+import argparse
+import random
+import time
+
+from src.algorithms import astar, cooperative_astar
+from src.problems.maps import random_map
+
+
+def make_agents(grid, count, seed):
+    rng = random.Random(seed)
+    free = [(r, c) for r, row in enumerate(grid) for c, cell in enumerate(row) if cell == 0]
+    cells = rng.sample(free, 2 * count)
+    return list(zip(cells[:count], cells[count:]))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--size", type=int, default=64)
+    parser.add_argument("--density", type=float, default=0.1)
+    parser.add_argument("--agents", type=int, nargs="+", default=[50, 100, 200, 400])
+    parser.add_argument("--window", type=int, default=16, help="WHCA* window")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    size = args.size
+    grid, _, _ = random_map(size, size, seed=args.seed, density=args.density)
+
+    print(f"{'Agents':>6} {'Planner':<18} {'Time(ms)':>10} {'Agents/s':>10} {'At Goal':>8} "
+          f"{'Conflicts':>10} {'Nodes Explored':>15}")
+    for count in args.agents:
+        agents = make_agents(grid, count, args.seed)
+        planners = [
+            ("A* (independent)", lambda: ([astar.solve(s, g, grid, size, size)[0] for s, g in agents], 0)),
+            ("HCA*", lambda: cooperative_astar.solve(agents, grid, size, size)),
+            (f"WHCA* (w={args.window})", lambda: cooperative_astar.solve(agents, grid, size, size,
+                                                                       window=args.window)),
+        ]
+        for name, plan in planners:
+            t0 = time.perf_counter()
+            paths, nodes = plan()
+            elapsed = time.perf_counter() - t0
+
+            at_goal = sum(1 for path, (_, goal) in zip(paths, agents) if path and path[-1] == goal)
+            conflicts = len(cooperative_astar.find_conflicts(paths, [start for start, _ in agents]))
+            print(f"{count:>6} {name:<18} {elapsed * 1000:>10.1f} {count / elapsed:>10.0f} {at_goal:>8} "
+                  f"{conflicts:>10} {nodes:>15}")
+        print()
+
+
+if __name__ == "__main__":
+    main()
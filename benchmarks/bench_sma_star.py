@@ -0,0 +1,73 @@
+"""
+Measure what a memory cap costs SMA* compared with unbounded A*.
+
+For every map kind, A* runs once to get the path cost and its node count. SMA*
+then runs with caps at several fractions of that count (never below the
+solution path length) and reports nodes regenerated, peak stored nodes and
+dropped-node records, time and peak memory (tracemalloc).
+
+Usage:
+    python -m benchmarks.bench_sma_star --size 64 --fractions 1 0.5 0.25 0.1
+"""
+import argparse
+import time
+import tracemalloc
+
+from src.algorithms import astar, sma_star
+from src.problems.grid_problem import GridProblem
+from src.problems.maps import MAPS
+
+
+def run(search_fn, problem):
+    """Returns (path, time in seconds, peak traced memory in bytes)."""
+    t0 = time.perf_counter()
+    path, _ = search_fn(problem)
+    elapsed = time.perf_counter() - t0
+
+    tracemalloc.start()
+    search_fn(problem)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return path, elapsed, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--size", type=int, nargs="+", default=[64])
+    parser.add_argument("--fractions", type=float, nargs="+", default=[1.0, 0.5, 0.25, 0.1])
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--time-limit", type=float, default=30.0, help="seconds per SMA* run")
+    args = parser.parse_args()
+
+    print(f"{'Map':<18} {'Algorithm':<16} {'Cost':>6} {'Expanded':>9} {'Regen':>8} "
+          f"{'Peak Nodes':>11} {'Records':>8} {'Time(ms)':>9} {'Memory(KB)':>11}")
+    for size in args.size:
+        for kind, make_map in MAPS.items():
+            grid, start, goal = make_map(size, size, args.seed)
+            problem = GridProblem(start, goal, grid, size, size)
+            label = f"{kind} {size}x{size}"
+
+            path, elapsed, peak = run(astar.search, problem)
+            cost = len(path) - 1 if path is not None else None
+            _, astar_nodes = astar.search(problem)
+            print(f"{label:<18} {'A*':<16} {str(cost):>6} {astar_nodes:>9} {'-':>8} "
+                  f"{'-':>11} {'-':>8} {elapsed * 1000:>9.2f} {peak / 1024:>11.1f}")
+
+            min_cap = len(path) if path is not None else 2
+            for fraction in args.fractions:
+                cap = max(min_cap, int(astar_nodes * fraction))
+                stats = {}
+
+                def search_fn(p):
+                    return sma_star.search(p, max_nodes=cap, stats=stats, time_limit=args.time_limit)
+
+                path, elapsed, peak = run(search_fn, problem)
+                cost = len(path) - 1 if path is not None else None
+                print(f"{label:<18} {f'SMA* cap={cap}':<16} {str(cost):>6} {stats['expansions']:>9} "
+                      f"{stats['regenerated']:>8} {stats['peak_nodes']:>11} {stats['peak_records']:>8} "
+                      f"{elapsed * 1000:>9.2f} {peak / 1024:>11.1f}")
+            print()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""
+Cold start time of the library, the command line tool and the GUI module.
+
+Each target is imported in a fresh interpreter several times and the median
+wall time is reported, together with the heavy GUI modules (tkinter,
+matplotlib, PIL) that ended up loaded.
+
+Usage:
+    python -m benchmarks.bench_startup --runs 10
+"""
+import argparse
+import statistics
+import subprocess
+import sys
+import time
+
+TARGETS = [
+    ("Python interpreter", "pass"),
+    ("Library (A*)", "import src.algorithms.astar"),
+    ("Library (all solvers)", "from src.algorithms import ALGORITHMS, get_algorithm\n"
+                              "for name in ALGORITHMS: get_algorithm(name)"),
+    ("CLI", "import src.cli"),
+    ("GUI module", "import src.main"),
+]
+
+REPORT_MODULES = "import sys; print(','.join(m for m in ('tkinter', 'matplotlib', 'PIL') if m in sys.modules))"
+
+
+def cold_start(code, runs):
+    """Returns (median ms, heavy modules loaded) for running 'code' in a new interpreter."""
+    times = []
+    for _ in range(runs):
+        t0 = time.perf_counter()
+        subprocess.run([sys.executable, "-c", code], check=True, stdout=subprocess.DEVNULL)
+        times.append((time.perf_counter() - t0) * 1000)
+
+    loaded = subprocess.run([sys.executable, "-c", code + "\n" + REPORT_MODULES], check=True,
+                            capture_output=True, text=True).stdout.strip().splitlines()
+    return statistics.median(times), loaded[-1] if loaded else ""
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=10)
+    args = parser.parse_args()
+
+    print(f"{'Target':<24} {'Median(ms)':>10}  Heavy modules loaded")
+    for name, code in TARGETS:
+        try:
+            median, loaded = cold_start(code, args.runs)
+        except subprocess.CalledProcessError:
+            print(f"{name:<24} {'failed':>10}  (missing dependency?)")
+            continue
+        print(f"{name:<24} {median:>10.1f}  {loaded or '-'}")
+
+
+if __name__ == "__main__":
+    main()
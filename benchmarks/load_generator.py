@@ -0,0 +1,135 @@
+"""
+Local load generator for the path-query service (src/service.py).
+
+Sends POST /solve requests over keep-alive HTTP connections and reports
+throughput and latency percentiles, plus the service's coalescing stats.
+Queries pick random starts and goals from small pools of free cells, so
+some requests repeat (coalesced) and many share a goal (batched).
+
+By default a service is spawned for the run; use --connect to target a running one
+(its --map must match this one).
+
+Usage:
+    python -m benchmarks.load_generator --map maze=maze:64:1 --requests 2000 --concurrency 64
+"""
+import argparse
+import asyncio
+import json
+import random
+import statistics
+import subprocess
+import sys
+import time
+
+from src.service import parse_map_spec
+
+
+async def http_request(reader, writer, method, path, payload=None):
+    body = json.dumps(payload).encode() if payload is not None else b""
+    writer.write(f"{method} {path} HTTP/1.1\r\nHost: localhost\r\nContent-Type: application/json\r\n"
+                 f"Content-Length: {len(body)}\r\n\r\n".encode() + body)
+    await writer.drain()
+
+    status = (await reader.readline()).split()[1]
+    length = 0
+    while (line := await reader.readline()) not in (b"\r\n", b""):
+        name, _, value = line.decode().partition(":")
+        if name.lower() == "content-length":
+            length = int(value)
+    return int(status), json.loads(await reader.readexactly(length))
+
+
+async def run_load(host, port, queries, concurrency):
+    """Sends all queries over 'concurrency' connections. Returns (latencies in ms, errors, elapsed s)."""
+    latencies = []
+    errors = 0
+    queue = asyncio.Queue()
+    for q in queries:
+        queue.put_nowait(q)
+
+    async def client():
+        nonlocal errors
+        reader, writer = await asyncio.open_connection(host, port)
+        while not queue.empty():
+            query = queue.get_nowait()
+            t0 = time.perf_counter()
+            status, _ = await http_request(reader, writer, "POST", "/solve", query)
+            latencies.append((time.perf_counter() - t0) * 1000)
+            if status != 200:
+                errors += 1
+        writer.close()
+
+    t0 = time.perf_counter()
+    await asyncio.gather(*(client() for _ in range(concurrency)))
+    return latencies, errors, time.perf_counter() - t0
+
+
+async def fetch_stats(host, port):
+    reader, writer = await asyncio.open_connection(host, port)
+    _, stats = await http_request(reader, writer, "GET", "/stats")
+    writer.close()
+    return stats
+
+
+def spawn_service(map_spec, workers):
+    """Starts the service on a free port and returns (process, port)."""
+    cmd = [sys.executable, "-m", "src.service", "--map", map_spec, "--port", "0"]
+    if workers:
+        cmd += ["--workers", str(workers)]
+    proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, text=True)
+    line = proc.stdout.readline()  # "[-] Listening on http://127.0.0.1:PORT"
+    return proc, int(line.rsplit(":", 1)[1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--map", required=True, metavar="NAME=SOURCE")
+    parser.add_argument("--connect", metavar="HOST:PORT", help="use a running service instead of spawning one")
+    parser.add_argument("--workers", type=int, help="worker processes of the spawned service")
+    parser.add_argument("--algorithm", default="astar")
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=64)
+    parser.add_argument("--starts", type=int, default=200, help="size of the start cell pool")
+    parser.add_argument("--goals", type=int, default=4, help="size of the goal cell pool")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    name, (grid, rows, cols) = parse_map_spec(args.map)
+    rng = random.Random(args.seed)
+    free = [[r, c] for r in range(rows) for c in range(cols) if grid[r][c] == 0]
+    starts = rng.sample(free, min(args.starts, len(free)))
+    goals = rng.sample(free, min(args.goals, len(free)))
+    queries = [{"map": name, "algorithm": args.algorithm, "start": rng.choice(starts), "goal": rng.choice(goals)}
+               for _ in range(args.requests)]
+
+    proc = None
+    if args.connect:
+        host, port = args.connect.rsplit(":", 1)
+        port = int(port)
+    else:
+        proc, port = spawn_service(args.map, args.workers)
+        host = "127.0.0.1"
+
+    try:
+        latencies, errors, elapsed = asyncio.run(run_load(host, port, queries, args.concurrency))
+        stats = asyncio.run(fetch_stats(host, port))
+    finally:
+        if proc is not None:
+            proc.terminate()
+            proc.wait()
+
+    latencies.sort()
+
+    def pct(p):
+        return latencies[min(len(latencies) - 1, int(p / 100 * len(latencies)))]
+
+    print(f"Requests: {len(latencies)} ({errors} errors) over {args.concurrency} connections")
+    print(f"Throughput: {len(latencies) / elapsed:.0f} req/s")
+    print(f"Latency (ms): mean {statistics.mean(latencies):.2f}  p50 {pct(50):.2f}  p95 {pct(95):.2f}  "
+          f"p99 {pct(99):.2f}  max {latencies[-1]:.2f}")
+    print(f"Service: {stats['requests']} requests, {stats['coalesced']} coalesced, "
+          f"{stats['solved']} solved in {stats['batches']} batches")
+
+
+if __name__ == "__main__":
+    main()
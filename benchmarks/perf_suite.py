@@ -0,0 +1,191 @@
+"""
+Performance regression suite: every solver on fixed seeded maps at several sizes.
+
+Each case records time, nodes explored, path cost and peak memory (tracemalloc).
+Times are divided by a short calibration workload run on the same machine, so the
+baseline is not tied to the speed of the computer that recorded it.
+tests/test_performance.py compares a fresh run against perf_baseline.json.
+
+Usage:
+    python -m benchmarks.perf_suite            # print a report against the baseline
+    python -m benchmarks.perf_suite --update   # re-record perf_baseline.json
+"""
+import argparse
+import collections
+import heapq
+import json
+import os
+import time
+import tracemalloc
+
+from src.algorithms import ALGORITHMS, get_algorithm
+from src.problems.grid_problem import GridProblem
+from src.problems.maps import MAPS
+
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "perf_baseline.json")
+
+MAP_KINDS = ["open", "maze", "rooms", "unreachable"]
+SIZES = [16, 32, 64]
+SEED = 7
+
+# IDS re-expands the tree at every depth, so it only runs on small solvable maps.
+# SMA* under its memory cap (below) would regenerate the enclosed region of the
+# unreachable map many times over; tests/test_sma_star.py covers that case.
+SOLVER_SIZES = {"ids": [6]}
+SOLVER_SKIP_MAPS = {"ids": ["unreachable"], "sma_star": ["unreachable"]}
+
+# Randomized solvers get a fixed seed so their expansions are reproducible,
+# and annealing a step budget so failing cases stay short. SMA* gets a memory
+# cap below A*'s node count on the larger maps so dropping and regeneration are measured too.
+SOLVER_OPTIONS = {"simulated_annealing": {"seed": 0, "max_steps": 5000}, "sma_star": {"max_nodes": 500}}
+
+# A case regresses when it exceeds baseline * factor (+ a small absolute slack)
+TOLERANCES = {
+    "time": float(os.environ.get("PERF_TIME_TOLERANCE", 2.0)),
+    "nodes": 1.10,
+    "memory": 1.25,
+}
+NODES_SLACK = 2
+MEMORY_SLACK = 16 * 1024  # bytes
+TIME_FLOOR = 0.02  # calibration units; faster cases are too noisy to compare closely
+
+
+def cases():
+    """Yields (solver, map kind, size) for every case in the suite."""
+    for name in ALGORITHMS:
+        for kind in MAP_KINDS:
+            if kind in SOLVER_SKIP_MAPS.get(name, []):
+                continue
+            for size in SOLVER_SIZES.get(name, SIZES):
+                yield name, kind, size
+
+
+def case_key(name, kind, size):
+    return f"{name}/{kind}/{size}"
+
+
+def calibrate():
+    """
+    Times a fixed pure-Python workload (heap and dict operations, like the solvers).
+    Returns the best of five runs in seconds; measured times are reported in these units.
+    """
+    best = float('inf')
+    for _ in range(5):
+        t0 = time.perf_counter()
+        pq, seen = [], {}
+        for i in range(20000):
+            heapq.heappush(pq, (i * 7919) % 10007)
+            seen[i] = i
+        while pq:
+            heapq.heappop(pq)
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def reference_cost(grid, start, goal):
+    """Shortest path length by a plain BFS over the grid, independent of the solvers. None if unreachable."""
+    rows, cols = len(grid), len(grid[0])
+    dist = {start: 0}
+    queue = collections.deque([start])
+    while queue:
+        r, c = queue.popleft()
+        if (r, c) == goal:
+            return dist[goal]
+        for nr, nc in ((r + 1, c), (r, c + 1), (r - 1, c), (r, c - 1)):
+            if 0 <= nr < rows and 0 <= nc < cols and grid[nr][nc] == 0 and (nr, nc) not in dist:
+                dist[(nr, nc)] = dist[(r, c)] + 1
+                queue.append((nr, nc))
+    return None
+
+
+def measure(name, kind, size, unit, repeats=3):
+    """Runs one case and returns its metrics."""
+    grid, start, goal = MAPS[kind](size, size, SEED)
+    problem = GridProblem(start, goal, grid, size, size)
+    search = get_algorithm(name).search
+    options = SOLVER_OPTIONS.get(name, {})
+
+    best = float('inf')
+    for _ in range(repeats):
+        t0 = time.perf_counter()
+        path, nodes = search(problem, **options)
+        best = min(best, time.perf_counter() - t0)
+
+    # Memory is measured in a separate run because tracemalloc slows everything down
+    tracemalloc.start()
+    search(problem, **options)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        "time": round(best / unit, 4),
+        "nodes": nodes,
+        "cost": len(path) - 1 if path is not None else None,
+        "memory": peak,
+    }
+
+
+def run_suite():
+    """Measures every case. Returns {case key: metrics}."""
+    unit = calibrate()
+    return {case_key(*case): measure(*case, unit=unit) for case in cases()}
+
+
+def load_baseline(path=BASELINE_PATH):
+    with open(path) as f:
+        return json.load(f)["cases"]
+
+
+def save_baseline(results, path=BASELINE_PATH):
+    with open(path, "w") as f:
+        json.dump({"seed": SEED, "cases": results}, f, indent=1, sort_keys=True)
+        f.write("\n")
+
+
+def compare(baseline, results):
+    """Returns a list of human-readable regressions of 'results' against 'baseline'."""
+    regressions = []
+    for key, new in sorted(results.items()):
+        old = baseline.get(key)
+        if old is None:
+            regressions.append(f"{key}: no baseline (run 'python -m benchmarks.perf_suite --update')")
+            continue
+
+        if old["cost"] is not None and (new["cost"] is None or new["cost"] > old["cost"]):
+            regressions.append(f"{key}: path cost {old['cost']} -> {new['cost']}")
+        if new["nodes"] > old["nodes"] * TOLERANCES["nodes"] + NODES_SLACK:
+            regressions.append(f"{key}: nodes explored {old['nodes']} -> {new['nodes']}")
+        if new["time"] > max(old["time"], TIME_FLOOR) * TOLERANCES["time"]:
+            regressions.append(f"{key}: time {old['time']} -> {new['time']} (calibration units)")
+        if new["memory"] > old["memory"] * TOLERANCES["memory"] + MEMORY_SLACK:
+            regressions.append(f"{key}: peak memory {old['memory']} -> {new['memory']} bytes")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--update", action="store_true", help="overwrite the baseline with this run")
+    args = parser.parse_args()
+
+    results = run_suite()
+    if args.update:
+        save_baseline(results)
+        print(f"[-] Saved {len(results)} cases to {BASELINE_PATH}")
+        return 0
+
+    baseline = load_baseline()
+    print(f"{'Case':<34} {'Time':>8} {'Base':>8} {'Nodes':>7} {'Base':>7} {'Memory':>9} {'Base':>9}")
+    for key, new in sorted(results.items()):
+        old = baseline.get(key, {"time": "-", "nodes": "-", "memory": "-"})
+        print(f"{key:<34} {new['time']:>8} {old['time']:>8} {new['nodes']:>7} {old['nodes']:>7} "
+              f"{new['memory']:>9} {old['memory']:>9}")
+
+    regressions = compare(baseline, results)
+    print(f"\n{len(regressions)} regression(s)")
+    for line in regressions:
+        print(f"[!] {line}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
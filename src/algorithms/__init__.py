@@ -0,0 +1,19 @@
+# src/algorithms/__init__.py
+
+import importlib
+
+# Single-agent solvers by short name. Every module provides search(problem) and
+# the grid solve(...) used by the GUI. Modules are imported on first use only.
+ALGORITHMS = ["bfs", "dfs", "ucs", "ids", "astar", "greedy", "hill_climbing", "beam_search", "simulated_annealing",
+              "sma_star"]
+
+# Solvers guaranteed to return a cheapest path (on grids with unit move costs;
+# for sma_star, as long as the path fits within its max_nodes memory cap)
+OPTIMAL = ["bfs", "ucs", "ids", "astar", "sma_star"]
+
+
+def get_algorithm(name):
+    """Returns the solver module registered under 'name'."""
+    if name not in ALGORITHMS:
+        raise ValueError(f"unknown algorithm {name!r}, expected one of: {', '.join(ALGORITHMS)}")
+    return importlib.import_module(f"{__name__}.{name}")
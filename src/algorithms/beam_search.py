@@ -0,0 +1,53 @@
+# src/algorithms/beam_search.py
+
+import heapq
+from .local_search import Budget
+from ..problems.grid_problem import GridProblem, grid_ui_callback
+from ..problems.problem import SearchNode, reconstruct_states
+
+
+def search(problem, update_ui=None, beam_width=10, max_steps=None, time_limit=None):
+    """
+    Local Beam Search on any Problem.
+    Expands the whole beam level by level and keeps only the 'beam_width'
+    successors with the lowest h(n). Incomplete: fails if the beam empties.
+    """
+    budget = Budget(max_steps, time_limit)
+
+    beam = [SearchNode(problem.start, heuristic=problem.heuristic(problem.start))]
+    visited = bytearray(problem.num_states)
+    visited[problem.start] = 1
+    nodes_explored = 0
+
+    while beam:
+        candidates = []
+
+        for current in beam:
+            if not budget.spend():
+                return None, nodes_explored
+            nodes_explored += 1
+
+            if update_ui:
+                update_ui(current)
+
+            if problem.is_goal(current.state):
+                return reconstruct_states(current, problem), nodes_explored
+
+            for nxt, _ in problem.successors(current.state):
+                if not visited[nxt]:
+                    visited[nxt] = 1
+                    candidates.append(SearchNode(nxt, parent=current, heuristic=problem.heuristic(nxt)))
+
+        # Keep only the best 'beam_width' successors for the next level
+        beam = heapq.nsmallest(beam_width, candidates)
+
+    return None, nodes_explored
+
+
+def solve(start_pos, goal_pos, grid, rows, cols, update_ui=None):
+    """
+    Local Beam Search Implementation.
+    Keeps the best k states (by heuristic) at every level.
+    """
+    problem = GridProblem(start_pos, goal_pos, grid, rows, cols)
+    return search(problem, grid_ui_callback(problem, update_ui))
@@ -1,23 +1,24 @@
 # src/algorithms/bfs.py
 
 import collections
-from src.problems.grid_problem import Node, get_neighbors, reconstruct_path
+from ..problems.grid_problem import GridProblem, grid_ui_callback
+from ..problems.problem import SearchNode, reconstruct_states
 
 
-def solve(start_pos, goal_pos, grid, rows, cols, update_ui=None):
+def search(problem, update_ui=None):
     """
-    Breadth-First Search (BFS) Implementation.
-    Guarantees the shortest path in an unweighted grid.
+    Breadth-First Search (BFS) on any Problem.
+    Guarantees the path with the fewest steps (edge costs are ignored).
     """
     # Initialize the starting node
-    start_node = Node(start_pos[0], start_pos[1])
+    start_node = SearchNode(problem.start)
 
     # Use a Queue (First-In-First-Out) for BFS
     queue = collections.deque([start_node])
 
-    # Keep track of visited nodes to avoid cycles
-    visited = set()
-    visited.add(start_pos)
+    # Keep track of visited states to avoid cycles (one byte per state id)
+    visited = bytearray(problem.num_states)
+    visited[problem.start] = 1
 
     nodes_explored = 0
 
@@ -30,18 +31,27 @@ def solve(start_pos, goal_pos, grid, rows, cols, update_ui=None):
             update_ui(current)
 
         # Check if the goal is reached
-        if (current.r, current.c) == goal_pos:
-            return reconstruct_path(current), nodes_explored
-
-        # Expand neighbors
-        for nr, nc in get_neighbors(current, grid, rows, cols):
-            if (nr, nc) not in visited:
-                visited.add((nr, nc))
-                new_node = Node(nr, nc, parent=current)
+        if problem.is_goal(current.state):
+            return reconstruct_states(current, problem), nodes_explored
+
+        # Expand successors
+        for nxt, _ in problem.successors(current.state):
+            if not visited[nxt]:
+                visited[nxt] = 1
+                new_node = SearchNode(nxt, parent=current)
                 queue.append(new_node)
 
                 # Optional: visual update for the frontier
                 if update_ui: update_ui(new_node)
 
     # Goal not found
-    return None, nodes_explored
\ No newline at end of file
+    return None, nodes_explored
+
+
+def solve(start_pos, goal_pos, grid, rows, cols, update_ui=None):
+    """
+    Breadth-First Search (BFS) Implementation.
+    Guarantees the shortest path in an unweighted grid.
+    """
+    problem = GridProblem(start_pos, goal_pos, grid, rows, cols)
+    return search(problem, grid_ui_callback(problem, update_ui))
@@ -0,0 +1,277 @@
+# src/algorithms/cooperative_astar.py
+
+import collections
+import heapq
+from array import array
+
+from ..problems.grid_problem import GridProblem
+from ..problems.problem import SearchNode
+from ..problems.reservation_table import ReservationTable
+
+
+def build_adjacency(problem):
+    """
+    Lists the successors of every cell once, so the many searches
+    of a multi-agent query do not regenerate them.
+    """
+    return [[nxt for nxt, _ in problem.successors(cell)] for cell in range(problem.num_states)]
+
+
+def true_distance(adjacency, goal, blocked=()):
+    """
+    Exact distance from every cell to the goal, ignoring other agents
+    (a reverse BFS from the goal; grid moves cost 1 and are reversible).
+    Used as the heuristic of Hierarchical Cooperative A*. -1 = unreachable.
+    Cells in 'blocked' are treated as walls.
+    """
+    dist = array('i', [-1]) * len(adjacency)
+    dist[goal] = 0
+    queue = collections.deque([goal])
+
+    while queue:
+        cell = queue.popleft()
+        for nxt in adjacency[cell]:
+            if dist[nxt] < 0 and nxt not in blocked:
+                dist[nxt] = dist[cell] + 1
+                queue.append(nxt)
+    return dist
+
+
+def space_time_astar(adjacency, dist, goal, table, agent, start_cell, start_time, window=None):
+    """
+    A* over (cell, timestep) states that avoids the cells and swaps
+    already reserved by other agents. Waiting in place is a move.
+
+    Without a window, returns the cells (one per timestep) up to a goal cell
+    the agent can rest on. With a window, stops after 'window' timesteps and
+    relies on the true distance heuristic for the rest of the way.
+    Returns (cells, nodes_explored); cells is None if no plan exists.
+    """
+    n = len(adjacency)
+    if dist[start_cell] < 0:
+        return None, 0
+
+    # Nobody can be in the way after the last reservation, so this bounds the search
+    horizon = start_time + (window if window is not None else table.max_time + n)
+
+    # Once every parked agent has arrived, parked cells are walls for good: from then on
+    # only cells still connected to the goal are worth visiting. Computed on first need.
+    settled = None if window is not None else max((arrival for arrival, _ in table.parked.values()), default=0)
+    goal_region = None
+
+    start_key = start_time * n + start_cell
+    pq = [SearchNode(start_key, cost=0, heuristic=dist[start_cell])]
+    closed = set()
+    nodes_explored = 0
+
+    while pq:
+        current = heapq.heappop(pq)
+        if current.state in closed:
+            continue
+        closed.add(current.state)
+        nodes_explored += 1
+
+        t, cell = divmod(current.state, n)
+        if window is not None:
+            done = t - start_time >= window
+        else:
+            done = cell == goal and table.can_rest(cell, t)
+        if done:
+            cells = []
+            node = current
+            while node:
+                cells.append(node.state % n)
+                node = node.parent
+            return cells[::-1], nodes_explored
+
+        if t >= horizon:
+            continue
+
+        if goal_region is None and settled is not None and t + 1 >= settled:
+            goal_region = true_distance(adjacency, goal, blocked=table.parked)
+
+        for nxt in adjacency[cell] + [cell]:  # Moves, then Wait
+            key = (t + 1) * n + nxt
+            if key in closed or dist[nxt] < 0:
+                continue
+            if goal_region is not None and goal_region[nxt] < 0:
+                continue  # Cut off from the goal by parked agents
+            if not table.is_free(nxt, t + 1, agent) or table.is_swap(cell, nxt, t, agent):
+                continue
+
+            # Waiting on the goal is free, so agents prefer to stay once they arrive
+            step = 0 if nxt == cell == goal else 1
+            heapq.heappush(pq, SearchNode(key, parent=current, cost=current.cost + step, heuristic=dist[nxt]))
+
+    return None, nodes_explored
+
+
+def solve(agents, grid, rows, cols, window=None, max_time=None):
+    """
+    Multi-agent pathfinding with (Windowed) Hierarchical Cooperative A*.
+
+    'agents' is a list of (start_pos, goal_pos) pairs. Agents are planned one
+    after another against a shared space-time ReservationTable, so later agents
+    route around earlier ones instead of colliding with them.
+
+    window=None: HCA*. Each agent is planned once, all the way to its goal,
+                 and then parks there.
+    window=w:    WHCA*. Every round each agent plans only w steps ahead, the
+                 first w // 2 are executed, and the priority order rotates.
+                 Stops once all agents are at their goals or after max_time steps.
+
+    Returns (paths, nodes_explored). paths[i] lists agent i's cell at every
+    timestep, or is None if HCA* could not plan that agent; such an agent stays
+    on its start cell and the other paths avoid it.
+    """
+    if len({start for start, _ in agents}) < len(agents) or len({goal for _, goal in agents}) < len(agents):
+        raise ValueError("agents must have distinct start and goal cells")
+
+    problems = [GridProblem(start, goal, grid, rows, cols) for start, goal in agents]
+    if not problems:
+        return [], 0
+
+    adjacency = build_adjacency(problems[0])
+    distances = {}
+    for problem in problems:
+        if problem.goal not in distances:
+            distances[problem.goal] = true_distance(adjacency, problem.goal)
+
+    if window is None:
+        return _solve_full(problems, adjacency, distances)
+    return _solve_windowed(problems, adjacency, distances, window,
+                           max_time if max_time is not None else rows * cols)
+
+
+def _solve_full(problems, adjacency, distances):
+    stuck = set()  # Agents that could not be planned: they stay on their start cell
+    plans = []  # Cells of every agent planned so far (None for stuck agents)
+    nodes_explored = 0
+
+    while True:
+        table = ReservationTable(len(adjacency))
+        # Agents that are planned later still occupy their start cell at time 0, stuck ones for good
+        for agent, problem in enumerate(problems):
+            table.reserve([problem.start], 0, agent, park=agent in stuck)
+        for agent, cells in enumerate(plans):
+            if cells is not None:
+                table.reserve(cells, 0, agent, park=True)
+
+        replan_from = None
+        for agent in range(len(plans), len(problems)):
+            problem = problems[agent]
+            cells = None
+            if agent not in stuck:
+                cells, nodes = space_time_astar(adjacency, distances[problem.goal], problem.goal, table, agent,
+                                                problem.start, 0)
+                nodes_explored += nodes
+            plans.append(cells)
+            if cells is not None:
+                table.reserve(cells, 0, agent, park=True)
+            elif agent not in stuck:
+                stuck.add(agent)
+                if table.can_rest(problem.start, 0):
+                    table.reserve([problem.start], 0, agent, park=True)
+                else:
+                    # An earlier agent passes through this start cell later on: plan again from
+                    # the first such agent (earlier plans never touch the cell, so they stay valid)
+                    replan_from = next(i for i, c in enumerate(plans) if c and problem.start in c[1:])
+                    break
+
+        if replan_from is None:
+            paths = [[p.decode(c) for c in cells] if cells is not None else None for p, cells in zip(problems, plans)]
+            return paths, nodes_explored
+        del plans[replan_from:]
+
+
+def _plan_round(order, problems, adjacency, distances, positions, t, window):
+    """
+    Plans 'window' steps for every agent in priority order.
+    Returns (plans, blocked, nodes_explored); 'blocked' is the first agent
+    that found no collision-free plan, or None if everybody succeeded.
+    """
+    table = ReservationTable(len(adjacency))
+    # Everyone holds their current cell at time t before anyone plans
+    for agent in order:
+        table.reserve([positions[agent]], t, agent)
+
+    plans = {}
+    nodes_explored = 0
+    for agent in order:
+        problem = problems[agent]
+        cells, nodes = space_time_astar(adjacency, distances[problem.goal], problem.goal, table, agent,
+                                        positions[agent], t, window)
+        nodes_explored += nodes
+        if cells is None:
+            return plans, agent, nodes_explored
+        table.reserve(cells, t, agent)
+        plans[agent] = cells
+    return plans, None, nodes_explored
+
+
+def _solve_windowed(problems, adjacency, distances, window, max_time):
+    num_agents = len(problems)
+    positions = [p.start for p in problems]
+    cells_so_far = [[p.start] for p in problems]
+    step = max(1, window // 2)
+    nodes_explored = 0
+    t = 0
+
+    while t < max_time and any(positions[i] != problems[i].goal for i in range(num_agents)):
+        # Rotate priorities so no agent is always planned last
+        first = (t // step) % num_agents
+        order = list(range(first, num_agents)) + list(range(first))
+
+        # An agent that gets boxed in moves to the front of the order and the round is replanned
+        for _ in range(num_agents):
+            plans, blocked, nodes = _plan_round(order, problems, adjacency, distances, positions, t, window)
+            nodes_explored += nodes
+            if blocked is None or order[0] == blocked:
+                break
+            order.remove(blocked)
+            order.insert(0, blocked)
+
+        for agent in range(num_agents):
+            # Agents left without a plan stay put (this can only happen when the map is overcrowded)
+            cells = plans.get(agent, [positions[agent]] * (window + 1))
+            cells_so_far[agent].extend(cells[1:step + 1])
+            positions[agent] = cells_so_far[agent][-1]
+        t += step
+
+    paths = [[p.decode(c) for c in cells] for p, cells in zip(problems, cells_so_far)]
+    return paths, nodes_explored
+
+
+def find_conflicts(paths, starts=None):
+    """
+    Returns a list of (timestep, agent_a, agent_b) collisions: two agents in the
+    same cell at once, or swapping cells in one step. Agents stay on their
+    last cell after their path ends. Unplanned agents (None) stand on their
+    start cell if 'starts' (one cell per agent) is given, and are ignored otherwise.
+    """
+    if starts is not None:
+        paths = [p if p is not None else [start] for p, start in zip(paths, starts)]
+    planned = [(i, p) for i, p in enumerate(paths) if p]
+    if not planned:
+        return []
+    end = max(len(p) for _, p in planned)
+
+    def at(path, t):
+        return path[t] if t < len(path) else path[-1]
+
+    conflicts = []
+    for t in range(end):
+        occupied = {}
+        for i, path in planned:
+            cell = at(path, t)
+            if cell in occupied:
+                conflicts.append((t, occupied[cell], i))
+            occupied[cell] = i
+        # Head-on swaps between t and t + 1
+        if t + 1 < end:
+            moves = {(at(path, t), at(path, t + 1)): i for i, path in planned if at(path, t) != at(path, t + 1)}
+            for (a, b), i in moves.items():
+                j = moves.get((b, a))
+                if j is not None and i < j:
+                    conflicts.append((t, i, j))
+    return conflicts
@@ -1,38 +1,48 @@
 # src/algorithms/dfs.py
 
-from src.problems.grid_problem import Node, get_neighbors, reconstruct_path
+from ..problems.grid_problem import GridProblem, grid_ui_callback
+from ..problems.problem import SearchNode, reconstruct_states
 
 
-def solve(start_pos, goal_pos, grid, rows, cols, update_ui=None):
+def search(problem, update_ui=None):
     """
-    Depth-First Search (DFS) Implementation.
+    Depth-First Search (DFS) on any Problem.
     Uses a Stack. Does NOT guarantee the shortest path.
     """
-    start_node = Node(start_pos[0], start_pos[1])
+    start_node = SearchNode(problem.start)
 
     # Use a List as a Stack (Last-In-First-Out)
     stack = [start_node]
-    visited = set()
+    visited = bytearray(problem.num_states)
     nodes_explored = 0
 
     while stack:
         current = stack.pop()
 
         # Skip if already visited
-        if (current.r, current.c) in visited:
+        if visited[current.state]:
             continue
 
-        visited.add((current.r, current.c))
+        visited[current.state] = 1
         nodes_explored += 1
 
         if update_ui and nodes_explored % 5 == 0:
             update_ui(current)
 
-        if (current.r, current.c) == goal_pos:
-            return reconstruct_path(current), nodes_explored
+        if problem.is_goal(current.state):
+            return reconstruct_states(current, problem), nodes_explored
+
+        for nxt, _ in problem.successors(current.state):
+            if not visited[nxt]:
+                stack.append(SearchNode(nxt, parent=current))
 
-        for nr, nc in get_neighbors(current, grid, rows, cols):
-            if (nr, nc) not in visited:
-                stack.append(Node(nr, nc, parent=current))
+    return None, nodes_explored
 
-    return None, nodes_explored
\ No newline at end of file
+
+def solve(start_pos, goal_pos, grid, rows, cols, update_ui=None):
+    """
+    Depth-First Search (DFS) Implementation.
+    Uses a Stack. Does NOT guarantee the shortest path.
+    """
+    problem = GridProblem(start_pos, goal_pos, grid, rows, cols)
+    return search(problem, grid_ui_callback(problem, update_ui))
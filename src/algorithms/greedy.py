@@ -1,52 +1,58 @@
 # src/algorithms/greedy.py
 
 import heapq
-from src.problems.grid_problem import Node, get_neighbors, reconstruct_path
+from ..problems.grid_problem import GridProblem, grid_ui_callback
+from ..problems.problem import SearchNode, reconstruct_states
 
 
-def heuristic(r, c, goal_pos):
-    # Manhattan Distance
-    return abs(r - goal_pos[0]) + abs(c - goal_pos[1])
-
-
-def solve(start_pos, goal_pos, grid, rows, cols, update_ui=None):
+def search(problem, update_ui=None):
     """
-    Greedy Best-First Search Implementation.
+    Greedy Best-First Search on any Problem.
     Uses Priority Queue ordered ONLY by heuristic h(n).
     Ignores path cost g(n).
     """
-    h_start = heuristic(start_pos[0], start_pos[1], goal_pos)
+    h_start = problem.heuristic(problem.start)
 
     # We pass cost=0 because Greedy doesn't care about the past cost
-    start_node = Node(start_pos[0], start_pos[1], cost=0, heuristic=h_start)
+    start_node = SearchNode(problem.start, cost=0, heuristic=h_start)
 
     pq = []
     heapq.heappush(pq, start_node)
 
-    visited = set()
+    visited = bytearray(problem.num_states)
     nodes_explored = 0
 
     while pq:
         current = heapq.heappop(pq)
 
-        if (current.r, current.c) in visited:
+        if visited[current.state]:
             continue
 
-        visited.add((current.r, current.c))
+        visited[current.state] = 1
         nodes_explored += 1
 
         if update_ui and nodes_explored % 5 == 0:
             update_ui(current)
 
-        if (current.r, current.c) == goal_pos:
-            return reconstruct_path(current), nodes_explored
+        if problem.is_goal(current.state):
+            return reconstruct_states(current, problem), nodes_explored
 
-        for nr, nc in get_neighbors(current, grid, rows, cols):
-            if (nr, nc) not in visited:
-                new_h = heuristic(nr, nc, goal_pos)
+        for nxt, _ in problem.successors(current.state):
+            if not visited[nxt]:
+                new_h = problem.heuristic(nxt)
 
                 # Note: Cost remains 0, so sorting is purely based on h(n)
-                new_node = Node(nr, nc, parent=current, cost=0, heuristic=new_h)
+                new_node = SearchNode(nxt, parent=current, cost=0, heuristic=new_h)
                 heapq.heappush(pq, new_node)
 
-    return None, nodes_explored
\ No newline at end of file
+    return None, nodes_explored
+
+
+def solve(start_pos, goal_pos, grid, rows, cols, update_ui=None):
+    """
+    Greedy Best-First Search Implementation.
+    Uses Priority Queue ordered ONLY by heuristic h(n).
+    Ignores path cost g(n).
+    """
+    problem = GridProblem(start_pos, goal_pos, grid, rows, cols)
+    return search(problem, grid_ui_callback(problem, update_ui))
@@ -1,70 +1,114 @@
 # src/algorithms/hill_climbing.py
 
-from src.problems.grid_problem import Node, get_neighbors
+import random
+from .local_search import Budget
+from ..problems.grid_problem import GridProblem, grid_ui_callback
+from ..problems.problem import SearchNode
 
 
-def heuristic(r, c, goal_pos):
+def climb(problem, budget, update_ui=None, sideways=None, rng=None, noise=0.0):
     """
-    Manhattan Distance Heuristic.
+    One Hill Climbing attempt from the start state.
+    Returns (path, nodes_explored); path is None if the climber got stuck
+    or the budget ran out.
+
+    sideways: how many consecutive moves that do not reduce h(n) are allowed
+              before the attempt counts as stuck in a local optimum (None = unlimited).
+    rng, noise: if an rng is given, ties are broken randomly and with probability
+                'noise' a random unvisited successor is taken instead of the best one.
     """
-    return abs(r - goal_pos[0]) + abs(c - goal_pos[1])
+    current = SearchNode(problem.start)
+    current_h = problem.heuristic(current.state)
 
+    path = [current.state]
+    visited = {current.state}
 
-def solve(start_pos, goal_pos, grid, rows, cols, update_ui=None):
-    """
-    Hill Climbing Implementation (Steepest Ascent).
+    nodes_explored = 0
+    plateau = 0
 
-    Logic:
-    1. Start at the initial state.
-    2. Look at all neighbors.
-    3. Move to the neighbor with the lowest heuristic (closest to goal).
-    4. If no neighbor is better (or all are visited/blocked), STOP.
+    while budget.spend():
+        nodes_explored += 1
 
-    * Note: This algorithm does NOT backtrack. It gets stuck in local optima easily.
-    """
+        if update_ui:
+            update_ui(current)
 
-    # Initialize current node
-    current = Node(start_pos[0], start_pos[1])
+        # Check if goal is reached
+        if problem.is_goal(current.state):
+            return [problem.decode(s) for s in path], nodes_explored
 
-    path = []
-    path.append((current.r, current.c))
+        candidates = [nxt for nxt, _ in problem.successors(current.state) if nxt not in visited]
+        if not candidates:
+            # Dead end: Hill Climbing cannot backtrack
+            return None, nodes_explored
 
-    visited = set()
-    visited.add((current.r, current.c))
+        if rng is not None and rng.random() < noise:
+            best = rng.choice(candidates)
+            best_h = problem.heuristic(best)
+        else:
+            # Find the best successor (lowest h), breaking ties randomly if an rng is given
+            if rng is not None:
+                rng.shuffle(candidates)
+            best, best_h = None, float('inf')
+            for nxt in candidates:
+                h = problem.heuristic(nxt)
+                if h < best_h:
+                    best, best_h = nxt, h
 
-    nodes_explored = 0
+        # Local optimum check: count moves that do not bring us closer
+        plateau = plateau + 1 if best_h >= current_h else 0
+        if sideways is not None and plateau > sideways:
+            return None, nodes_explored
 
-    while True:
-        nodes_explored += 1
+        current = SearchNode(best, parent=current)
+        current_h = best_h
+        visited.add(best)
+        path.append(best)
 
-        if update_ui:
-            update_ui(current)
+    return None, nodes_explored
 
-        # Check if goal is reached
-        if (current.r, current.c) == goal_pos:
+
+def search(problem, update_ui=None, restarts=0, sideways=None, noise=0.05, seed=None,
+           max_steps=None, time_limit=None):
+    """
+    Hill Climbing (Steepest Ascent) on any Problem, with optional random restarts.
+
+    Without a seed, the first attempt is the classic deterministic climb. Each of the 'restarts'
+    extra attempts starts over from the start state with random tie-breaking and
+    random 'noise' moves, which lets later attempts walk out of the concave pockets
+    that trap the deterministic climber.
+    max_steps and time_limit bound the total work across all attempts.
+    """
+    budget = Budget(max_steps, time_limit)
+    # A seed makes every attempt randomized, so parallel workers explore different walks
+    rng = random.Random(seed) if seed is not None else None
+    nodes_explored = 0
+
+    for attempt in range(restarts + 1):
+        if attempt == 1 and rng is None:
+            rng = random.Random()
+        path, nodes = climb(problem, budget, update_ui, sideways, rng, noise)
+        nodes_explored += nodes
+        if path is not None:
             return path, nodes_explored
 
-        # Get all valid neighbors
-        neighbors = get_neighbors(current, grid, rows, cols)
+    return None, nodes_explored
 
-        best_neighbor = None
-        best_h = float('inf')
 
-        # Find the best neighbor (lowest H)
-        for nr, nc in neighbors:
-            if (nr, nc) not in visited:
-                h = heuristic(nr, nc, goal_pos)
-                if h < best_h:
-                    best_h = h
-                    best_neighbor = Node(nr, nc, parent=current)
-
-        # Decision logic
-        if best_neighbor is not None:
-            # Move to the best neighbor
-            current = best_neighbor
-            visited.add((current.r, current.c))
-            path.append((current.r, current.c))
-        else:
-            # Dead end or Local Maximum reached (no better neighbors)
-            # Hill Climbing fails here because it cannot backtrack
-            return None, nodes_explored
\ No newline at end of file
+def solve(start_pos, goal_pos, grid, rows, cols, update_ui=None, restarts=100, max_steps=None):
+    """
+    Hill Climbing Implementation (Steepest Ascent) with random restarts.
+
+    Logic:
+    1. Start at the initial state.
+    2. Look at all neighbors.
+    3. Move to the neighbor with the lowest heuristic (closest to goal).
+    4. If all neighbors are visited/blocked, start over with randomized moves.
+
+    * Note: A single climb does NOT backtrack and gets stuck in local optima easily;
+      the restarts let it escape the pockets of concave maps. The total work is
+      capped at 'max_steps' (default: 20 steps per cell).
+    """
+    problem = GridProblem(start_pos, goal_pos, grid, rows, cols)
+    if max_steps is None:
+        max_steps = 20 * rows * cols
+    return search(problem, grid_ui_callback(problem, update_ui), restarts=restarts, max_steps=max_steps)
@@ -1,36 +1,37 @@
 # src/algorithms/ids.py
 
-from src.problems.grid_problem import Node, get_neighbors, reconstruct_path
+from ..problems.grid_problem import GridProblem, grid_ui_callback
+from ..problems.problem import SearchNode, reconstruct_states
 
 
-def dls(node, goal_pos, grid, rows, cols, limit, visited, count_ref):
+def dls(node, problem, limit, visited, count_ref):
     """
     Depth-Limited Search (Helper function for IDS).
     Returns path if found, otherwise None.
     """
     count_ref[0] += 1
 
-    if (node.r, node.c) == goal_pos:
-        return reconstruct_path(node)
+    if problem.is_goal(node.state):
+        return reconstruct_states(node, problem)
 
     if limit <= 0:
         return None
 
-    visited.add((node.r, node.c))
+    visited.add(node.state)
 
-    for nr, nc in get_neighbors(node, grid, rows, cols):
-        if (nr, nc) not in visited:
+    for nxt, _ in problem.successors(node.state):
+        if nxt not in visited:
             # Recursive call with reduced limit
             # Note: We pass visited.copy() to allow other branches to visit these nodes in different paths
-            res = dls(Node(nr, nc, parent=node), goal_pos, grid, rows, cols, limit - 1, visited.copy(), count_ref)
+            res = dls(SearchNode(nxt, parent=node), problem, limit - 1, visited.copy(), count_ref)
             if res:
                 return res
     return None
 
 
-def solve(start_pos, goal_pos, grid, rows, cols, update_ui=None):
+def search(problem, update_ui=None):
     """
-    Iterative Deepening Search (IDS).
+    Iterative Deepening Search (IDS) on any Problem.
     Repeatedly calls DLS with increasing depth limits.
     """
     depth = 0
@@ -38,7 +39,7 @@ def solve(start_pos, goal_pos, grid, rows, cols, update_ui=None):
     total_nodes = [0]
 
     # Safety limit to prevent infinite loops if goal is unreachable
-    max_depth = rows * cols
+    max_depth = problem.num_states
 
     while depth <= max_depth:
         visited = set()
@@ -46,11 +47,20 @@ def solve(start_pos, goal_pos, grid, rows, cols, update_ui=None):
         # Force a UI update between iterations
         if update_ui: update_ui(None)
 
-        result = dls(Node(start_pos[0], start_pos[1]), goal_pos, grid, rows, cols, depth, visited, total_nodes)
+        result = dls(SearchNode(problem.start), problem, depth, visited, total_nodes)
 
         if result is not None:
             return result, total_nodes[0]
 
         depth += 1
 
-    return None, total_nodes[0]
\ No newline at end of file
+    return None, total_nodes[0]
+
+
+def solve(start_pos, goal_pos, grid, rows, cols, update_ui=None):
+    """
+    Iterative Deepening Search (IDS).
+    Repeatedly calls DLS with increasing depth limits.
+    """
+    problem = GridProblem(start_pos, goal_pos, grid, rows, cols)
+    return search(problem, grid_ui_callback(problem, update_ui))
@@ -0,0 +1,113 @@
+# src/algorithms/local_search.py
+
+import time
+
+
+class Budget:
+    """
+    Limits a local search by number of steps and/or wall-clock time (seconds).
+    A limit of None means unlimited.
+    """
+
+    def __init__(self, max_steps=None, time_limit=None):
+        self.max_steps = max_steps
+        self.deadline = time.perf_counter() + time_limit if time_limit is not None else None
+        self.steps = 0
+
+    def spend(self):
+        """Counts one step. Returns False once the budget is exhausted."""
+        self.steps += 1
+        if self.max_steps is not None and self.steps > self.max_steps:
+            return False
+        # Checking the clock is comparatively slow, so only do it every 256 steps
+        if self.deadline is not None and self.steps % 256 == 0:
+            return time.perf_counter() < self.deadline
+        return True
+
+
+class Walk:
+    """
+    The path followed by a local search agent.
+    Revisiting a state erases the loop back to its earlier occurrence,
+    so the walk is always a simple path from the start.
+    """
+
+    def __init__(self, start):
+        self.states = [start]
+        self.index = {start: 0}
+
+    @property
+    def current(self):
+        return self.states[-1]
+
+    def move(self, state):
+        i = self.index.get(state)
+        if i is not None:
+            # Loop detected: cut the walk back to the first visit of 'state'
+            for s in self.states[i + 1:]:
+                del self.index[s]
+            del self.states[i + 1:]
+        else:
+            self.index[state] = len(self.states)
+            self.states.append(state)
+
+    def decode(self, problem):
+        return [problem.decode(s) for s in self.states]
+
+
+def _run_attempt(search_fn, problem, seed, options):
+    """Worker entry point: runs one independent attempt with its own seed."""
+    return search_fn(problem, seed=seed, **options)
+
+
+def parallel_restarts(search_fn, problem, attempts=8, workers=None, mode="first", seed=0, executor=None,
+                      **options):
+    """
+    Runs independent attempts of a randomized local search across a process pool.
+
+    'search_fn' must be a module-level search function accepting a 'seed'
+    keyword (e.g. simulated_annealing.search), and 'problem' must be picklable.
+    Attempt i uses seed + i, so results are reproducible for mode="best".
+
+    mode="first": returns the first successful path; queued attempts are cancelled.
+    mode="best":  waits for every attempt and returns the cheapest path.
+
+    Pass an existing 'executor' to avoid paying the pool start-up cost on every call;
+    otherwise a pool with 'workers' processes is created for this call only.
+
+    Returns (path, nodes_explored) where nodes_explored sums all finished attempts.
+    """
+    if mode not in ("first", "best"):
+        raise ValueError(f"mode must be 'first' or 'best', got {mode!r}")
+
+    # Imported here: concurrent.futures pulls in multiprocessing, which slows down startup
+    from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+
+    best_path = None
+    best_cost = float('inf')
+    nodes_explored = 0
+
+    pool = executor or ProcessPoolExecutor(max_workers=workers)
+    pending = {pool.submit(_run_attempt, search_fn, problem, seed + i, options) for i in range(attempts)}
+    try:
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                path, nodes = future.result()
+                nodes_explored += nodes
+                if path is None:
+                    continue
+                if mode == "first":
+                    return path, nodes_explored
+
+                cost = problem.path_cost(path)
+                if cost < best_cost:
+                    best_path, best_cost = path, cost
+    finally:
+        # Attempts that are already running finish within their own budget
+        for future in pending:
+            future.cancel()
+        if executor is None:
+            pool.shutdown(wait=False)
+
+    return best_path, nodes_explored
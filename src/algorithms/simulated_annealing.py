@@ -0,0 +1,71 @@
+# src/algorithms/simulated_annealing.py
+
+import math
+import random
+from .local_search import Budget, Walk
+from ..problems.grid_problem import GridProblem, grid_ui_callback
+from ..problems.problem import SearchNode
+
+
+def search(problem, update_ui=None, t0=10.0, cooling=0.999, t_min=0.2, seed=None,
+           max_steps=None, time_limit=None):
+    """
+    Simulated Annealing on any Problem.
+
+    Logic:
+    1. Pick a random successor of the current state.
+    2. Always move if it lowers h(n); otherwise move with probability exp(-dh / T).
+    3. Multiply T by 'cooling' every step. When T drops below t_min, reheat to t0.
+
+    Revisiting a state erases the loop, so the returned path never repeats a cell.
+    Without max_steps or time_limit the search stops after 10 * num_states steps.
+    """
+    if max_steps is None and time_limit is None:
+        max_steps = 10 * problem.num_states
+    budget = Budget(max_steps, time_limit)
+    rng = random.Random(seed)
+
+    walk = Walk(problem.start)
+    current_h = problem.heuristic(problem.start)
+    temperature = t0
+    nodes_explored = 0
+
+    while budget.spend():
+        nodes_explored += 1
+        state = walk.current
+
+        if update_ui:
+            update_ui(SearchNode(state))
+
+        if problem.is_goal(state):
+            return walk.decode(problem), nodes_explored
+
+        successors = [nxt for nxt, _ in problem.successors(state)]
+        if not successors:
+            # Dead end: step back along the walk, or give up at an isolated start
+            if len(walk.states) == 1:
+                return None, nodes_explored
+            nxt = walk.states[-2]
+        else:
+            nxt = rng.choice(successors)
+
+        h = problem.heuristic(nxt)
+        dh = h - current_h
+        if dh <= 0 or rng.random() < math.exp(-dh / temperature):
+            walk.move(nxt)
+            current_h = h
+
+        temperature *= cooling
+        if temperature < t_min:
+            temperature = t0
+
+    return None, nodes_explored
+
+
+def solve(start_pos, goal_pos, grid, rows, cols, update_ui=None):
+    """
+    Simulated Annealing Implementation.
+    Accepts uphill moves with a probability that shrinks as the temperature cools.
+    """
+    problem = GridProblem(start_pos, goal_pos, grid, rows, cols)
+    return search(problem, grid_ui_callback(problem, update_ui))
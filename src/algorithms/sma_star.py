@@ -0,0 +1,271 @@
+# src/algorithms/sma_star.py
+
+import heapq
+import itertools
+from .local_search import Budget
+from ..problems.grid_problem import GridProblem, grid_ui_callback
+
+
+class SMANode:
+    """
+    A node of the SMA* search tree. Unlike the other solvers' nodes, it keeps
+    its children in memory so it can forget them and remember their best f-value.
+    """
+
+    __slots__ = ("state", "goal", "parent", "cost", "total_cost", "depth", "children", "forgotten", "version")
+
+    def __init__(self, state, goal, parent=None, cost=0, total_cost=0):
+        self.state = state
+        self.goal = goal  # Goal nodes win f-ties, so one is never dropped for a non-goal
+        self.parent = parent
+        self.cost = cost  # g(n)
+        self.total_cost = total_cost  # f(n), raised when forgotten children are backed up
+        self.depth = parent.depth + 1 if parent else 0
+        self.children = None  # state -> SMANode, only the children currently in memory (None for a leaf)
+        self.forgotten = float('inf')  # Lowest f of children dropped since the last expansion
+        self.version = 0  # Bumped whenever the node's queue key changes (lazy heap deletion)
+
+
+def search(problem, update_ui=None, max_nodes=10000, max_records=None, stats=None, max_steps=None,
+           time_limit=None):
+    """
+    Simplified Memory-Bounded A* (SMA*) on any Problem.
+
+    At most 'max_nodes' search nodes are kept in memory. When the limit is hit,
+    the worst leaf (highest f; on ties a non-goal, then the shallowest) is dropped
+    and its f-value is backed up into its parent, which is expanded again later if
+    that subtree becomes the most promising one. The returned path is optimal
+    whenever an optimal solution path fits within max_nodes nodes (and h(n) is
+    admissible). Zero-cost edges are allowed.
+
+    Dropped nodes are remembered as (state, g, depth, parent state, f) records so
+    that a dominated path to them is not searched again and a regenerated node gets
+    its backed-up f back. The records grow with the number of distinct states
+    dropped, so 'max_nodes' alone does not bound total memory. 'max_records'
+    bounds them too (the oldest are forgotten first; at least max_nodes). A
+    forgotten record loses its backed-up f, so below roughly max_nodes times the
+    branching factor the search can keep retrying the same dead ends and never
+    finish: combine a small 'max_records' with 'max_steps' / 'time_limit'.
+
+    If no solution fits, the search keeps regenerating nodes until every branch
+    is known to be too deep; 'max_steps' / 'time_limit' bound that case.
+
+    If a 'stats' dict is given it is filled with:
+        expansions, generated, regenerated (nodes generated again after being
+        dropped, i.e. the work the memory cap cost; with max_records only those
+        still remembered are counted), pruned (nodes dropped to stay under the
+        cap), peak_nodes, peak_records.
+    """
+    if max_nodes < 2:
+        raise ValueError("max_nodes must be at least 2")
+    if max_records is not None and max_records < max_nodes:
+        raise ValueError("max_records must be at least max_nodes")
+
+    budget = Budget(max_steps, time_limit)
+    INF = float('inf')
+    seq = itertools.count()
+
+    memory = {}  # state -> SMANode currently stored
+    # state -> (g, depth, parent state, f) of dropped nodes. Paths are ranked by
+    # (g, depth): among equally cheap paths the one with fewer nodes is more likely
+    # to fit in memory (this matters with zero-cost edges). A successor that does not
+    # rank better than a stored node or a dropped one is skipped: that path is backed
+    # up into a stored ancestor, or was removed because a better path to one of its
+    # nodes was found, which will generate the same states again. A node regenerated
+    # from its own record gets its backed-up f back, so a dead end is not retried.
+    dropped = {}
+    best_heap = []  # (key, not goal, -depth, seq, version, node): nodes to expand, lowest f and deepest first
+    worst_heap = []  # (-f, goal, depth, seq, version, node): leaves that may be dropped, highest f and shallowest first
+    counts = {"expansions": 0, "generated": 0, "regenerated": 0, "pruned": 0, "peak_nodes": 0, "peak_records": 0}
+
+    def schedule(node):
+        """(Re)queues a node after its f-value or children changed."""
+        node.version += 1
+        if not node.children:
+            # Leaf: expand it when its f is the lowest; it may also be dropped
+            heapq.heappush(best_heap, (node.total_cost, not node.goal, -node.depth, next(seq), node.version, node))
+            heapq.heappush(worst_heap, (-node.total_cost, node.goal, node.depth, next(seq), node.version, node))
+        elif node.forgotten < INF:
+            # Interior node with dropped children: re-expand when they look the most promising
+            heapq.heappush(best_heap, (node.forgotten, True, -node.depth, next(seq), node.version, node))
+
+        # Outdated entries are skipped lazily; rebuild the heaps before they outgrow the cap
+        # (at most two entries per stored node are still valid)
+        if len(best_heap) + len(worst_heap) > 3 * max_nodes:
+            best_heap[:] = [e for e in best_heap if valid(e)]
+            worst_heap[:] = [e for e in worst_heap if valid(e)]
+            heapq.heapify(best_heap)
+            heapq.heapify(worst_heap)
+
+    def valid(entry):
+        node = entry[-1]
+        return memory.get(node.state) is node and entry[-2] == node.version
+
+    def forget(node):
+        """Detaches a node taken out of memory, so outdated heap entries do not keep its ancestors alive."""
+        del memory[node.state]
+        node.version += 1
+        node.parent = node.children = None
+
+    def remove(node):
+        """Removes a node and its whole subtree from memory (no backup)."""
+        parent = node.parent
+        del parent.children[node.state]
+        stack = [node]
+        while stack:
+            n = stack.pop()
+            if n.children:
+                stack.extend(n.children.values())
+            forget(n)
+        if not parent.children:
+            parent.children = None
+            schedule(parent)
+
+    def remember(state, g, depth, parent_state, f):
+        """Records a dropped node so that only its own parent regenerates it, with the same f."""
+        dropped.pop(state, None)
+        dropped[state] = (g, depth, parent_state, f)
+        if max_records is not None and len(dropped) > max_records:
+            del dropped[next(iter(dropped))]
+        counts["peak_records"] = max(counts["peak_records"], len(dropped))
+
+    def drop(leaf):
+        """Forgets a leaf to free memory and backs its f-value up into its parent."""
+        parent = leaf.parent
+        remember(leaf.state, leaf.cost, leaf.depth, parent.state, leaf.total_cost)
+        del parent.children[leaf.state]
+        parent.forgotten = min(parent.forgotten, leaf.total_cost)
+        forget(leaf)
+        counts["pruned"] += 1
+        if parent is expanding:
+            return  # The expansion loop settles the parent's f and queues it once it is done
+        if not parent.children:
+            # Everything below the parent is forgotten: it becomes a leaf with the backed-up f
+            parent.children = None
+            parent.total_cost = max(parent.total_cost, parent.forgotten)
+        schedule(parent)
+
+    def worst_leaf(exclude):
+        """Returns the leaf to drop next (never the root or 'exclude'), or None."""
+        skipped = []
+        found = None
+        while worst_heap:
+            entry = heapq.heappop(worst_heap)
+            node = entry[-1]
+            if not valid(entry) or node.children:
+                continue
+            skipped.append(entry)
+            if node is not exclude and node.parent is not None:
+                found = node
+                break
+        for entry in skipped:
+            heapq.heappush(worst_heap, entry)
+        return found
+
+    root = SMANode(problem.start, problem.is_goal(problem.start), total_cost=problem.heuristic(problem.start))
+    memory[root.state] = root
+    schedule(root)
+
+    expanding = None  # Node whose successors are being generated
+    path = None
+    while best_heap and budget.spend():
+        entry = heapq.heappop(best_heap)
+        if not valid(entry):
+            continue
+        node = entry[-1]
+        if node.children and node.forgotten == INF:
+            continue  # Stale interior entry
+        if node.total_cost == INF:
+            break  # Everything left is a dead end or too deep to fit in memory
+
+        if update_ui and counts["expansions"] % 5 == 0:
+            update_ui(node)
+
+        if problem.is_goal(node.state):
+            path = []
+            while node:
+                path.append(problem.decode(node.state))
+                node = node.parent
+            path.reverse()
+            break
+
+        # --- Expand: generate every successor not currently stored under this node ---
+        counts["expansions"] += 1
+        node.forgotten = INF
+        expanding = node
+        node_f = node.total_cost  # Children inherit this f (pathmax), not values backed up meanwhile
+
+        # Children are keyed by state, so parallel edges collapse to the cheapest one
+        successors = {}
+        for nxt, step_cost in problem.successors(node.state):
+            if step_cost < successors.get(nxt, INF):
+                successors[nxt] = step_cost
+
+        for nxt, step_cost in successors.items():
+            if node.children and nxt in node.children:
+                continue
+            g = node.cost + step_cost
+            depth = node.depth + 1
+
+            existing = memory.get(nxt)
+            if existing is not None:
+                if (existing.cost, existing.depth) <= (g, depth):
+                    continue  # A path at least as good is stored
+                remove(existing)  # Dominated by the new path
+
+            backed_up = 0
+            known = dropped.get(nxt)
+            if known is not None:
+                if (g, depth) > known[:2] or ((g, depth) == known[:2] and known[2] != node.state):
+                    continue  # A path at least as good was dropped and backed up
+                if (g, depth) == known[:2]:
+                    counts["regenerated"] += 1  # Same node as before: it was dropped to save memory
+                    backed_up = known[3]
+                del dropped[nxt]
+            counts["generated"] += 1
+
+            # A child that cannot fit on a path within the cap can never lead to a solution
+            if depth + 1 > max_nodes:
+                f = INF
+            else:
+                f = max(node_f, g + problem.heuristic(nxt), backed_up)  # pathmax keeps f monotone
+
+            goal = problem.is_goal(nxt)
+            if len(memory) >= max_nodes:
+                victim = worst_leaf(exclude=node)
+                if victim is None or (victim.total_cost, not victim.goal, -victim.depth) < (f, not goal, -depth):
+                    # The new child is the worst node: forget it straight away
+                    node.forgotten = min(node.forgotten, f)
+                    remember(nxt, g, depth, node.state, f)
+                    counts["pruned"] += 1
+                    continue
+                drop(victim)
+
+            child = SMANode(nxt, goal, parent=node, cost=g, total_cost=f)
+            memory[nxt] = child
+            if node.children is None:
+                node.children = {}
+            node.children[nxt] = child
+            schedule(child)
+
+        expanding = None
+        if not node.children:
+            # Dead end, or every child was forgotten
+            node.children = None
+            node.total_cost = max(node.total_cost, node.forgotten)
+            node.forgotten = INF
+        schedule(node)
+        counts["peak_nodes"] = max(counts["peak_nodes"], len(memory))
+
+    if stats is not None:
+        stats.update(counts)
+    return path, counts["expansions"]
+
+
+def solve(start_pos, goal_pos, grid, rows, cols, update_ui=None):
+    """
+    SMA* (Simplified Memory-Bounded A*) Implementation.
+    Like A*, but keeps at most a fixed number of nodes in memory.
+    """
+    problem = GridProblem(start_pos, goal_pos, grid, rows, cols)
+    return search(problem, grid_ui_callback(problem, update_ui))
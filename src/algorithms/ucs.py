@@ -1,43 +1,52 @@
 # src/algorithms/ucs.py
 
 import heapq
-from src.problems.grid_problem import Node, get_neighbors, reconstruct_path
+from ..problems.grid_problem import GridProblem, grid_ui_callback
+from ..problems.problem import SearchNode, reconstruct_states
 
 
-def solve(start_pos, goal_pos, grid, rows, cols, update_ui=None):
+def search(problem, update_ui=None):
     """
-    Uniform-Cost Search (UCS) Implementation.
+    Uniform-Cost Search (UCS) on any Problem.
     Uses a Priority Queue ordered by path cost g(n).
     """
-    start_node = Node(start_pos[0], start_pos[1], cost=0)
+    start_node = SearchNode(problem.start, cost=0)
 
-    # Priority Queue stores tuples or objects. Node class handles comparison.
+    # Priority Queue stores tuples or objects. SearchNode handles comparison.
     pq = []
     heapq.heappush(pq, start_node)
 
-    visited = set()
+    visited = bytearray(problem.num_states)
     nodes_explored = 0
 
     while pq:
         current = heapq.heappop(pq)
 
-        if (current.r, current.c) in visited:
+        if visited[current.state]:
             continue
 
-        visited.add((current.r, current.c))
+        visited[current.state] = 1
         nodes_explored += 1
 
         if update_ui and nodes_explored % 10 == 0:
             update_ui(current)
 
-        if (current.r, current.c) == goal_pos:
-            return reconstruct_path(current), nodes_explored
+        if problem.is_goal(current.state):
+            return reconstruct_states(current, problem), nodes_explored
 
-        for nr, nc in get_neighbors(current, grid, rows, cols):
-            if (nr, nc) not in visited:
-                # Cost is incremented by 1 for each step
-                new_cost = current.cost + 1
-                new_node = Node(nr, nc, parent=current, cost=new_cost)
+        for nxt, step_cost in problem.successors(current.state):
+            if not visited[nxt]:
+                new_cost = current.cost + step_cost
+                new_node = SearchNode(nxt, parent=current, cost=new_cost)
                 heapq.heappush(pq, new_node)
 
-    return None, nodes_explored
\ No newline at end of file
+    return None, nodes_explored
+
+
+def solve(start_pos, goal_pos, grid, rows, cols, update_ui=None):
+    """
+    Uniform-Cost Search (UCS) Implementation.
+    Uses a Priority Queue ordered by path cost g(n).
+    """
+    problem = GridProblem(start_pos, goal_pos, grid, rows, cols)
+    return search(problem, grid_ui_callback(problem, update_ui))
@@ -0,0 +1,61 @@
+# src/cli.py
+
+import argparse
+import time
+
+from .algorithms import ALGORITHMS, get_algorithm
+from .problems.grid_problem import GridProblem
+from .problems.maps import load_map
+
+
+def parse_pos(text):
+    """Parses 'r,c' into a (row, column) tuple."""
+    try:
+        r, c = text.split(",")
+        return int(r), int(c)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected 'row,col', got {text!r}")
+
+
+def main(argv=None):
+    """
+    Entry point of the 'pathfinding' command.
+    Solves a grid map file without loading the GUI.
+    """
+    parser = argparse.ArgumentParser(prog="pathfinding", description="Solve a grid map with a search algorithm.")
+    parser.add_argument("map", help="map file ('.' empty, '#' wall, optional 'S' start and 'G' goal)")
+    parser.add_argument("-a", "--algorithm", choices=ALGORITHMS, default="astar")
+    parser.add_argument("--start", type=parse_pos, help="start cell as row,col (overrides 'S')")
+    parser.add_argument("--goal", type=parse_pos, help="goal cell as row,col (overrides 'G')")
+    args = parser.parse_args(argv)
+
+    grid, start, goal = load_map(args.map)
+    start = args.start or start
+    goal = args.goal or goal
+    if start is None or goal is None:
+        parser.error("the map has no 'S'/'G' cells; pass --start and --goal")
+
+    rows, cols = len(grid), len(grid[0])
+    for name, (r, c) in (("start", start), ("goal", goal)):
+        if not (0 <= r < rows and 0 <= c < cols) or grid[r][c] == 1:
+            parser.error(f"{name} {r},{c} is outside the map or on a wall")
+
+    problem = GridProblem(start, goal, grid, rows, cols)
+    t0 = time.perf_counter()
+    path, nodes = get_algorithm(args.algorithm).search(problem)
+    exec_time = (time.perf_counter() - t0) * 1000
+
+    print(f"Algorithm: {args.algorithm}")
+    print(f"Time: {exec_time:.2f} ms")
+    print(f"Nodes Explored: {nodes}")
+    if path is None:
+        print("No Path Found!")
+        return 1
+
+    print(f"Path Cost: {len(path) - 1}")
+    print("Path: " + " ".join(f"{r},{c}" for r, c in path))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -1,24 +1,34 @@
-import sys
 import os
 import time
 import csv
 from datetime import datetime
 import tkinter as tk
 from tkinter import ttk, messagebox
-import matplotlib.pyplot as plt  # Used for comparison charts
 
-# Try importing Pillow for screenshots; handle the case if it's not installed
-try:
-    from PIL import ImageGrab
-except ImportError:
-    ImageGrab = None
-    print("Pillow library not found. Screenshots will be disabled. (Run 'pip install Pillow' to enable)")
+# Import the implemented algorithms
+from .algorithms import OPTIMAL
+from .algorithms import bfs, dfs, ucs, ids, astar, greedy, hill_climbing, beam_search, simulated_annealing, sma_star
 
-# Add the project root directory to the system path to allow module imports
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# matplotlib and Pillow are only needed for charts and screenshots,
+# so they are imported on first use instead of at startup.
+_image_grab = None
+
+
+def load_image_grab():
+    """
+    Returns Pillow's ImageGrab module, or None if Pillow is not installed.
+    The import is attempted only once.
+    """
+    global _image_grab
+    if _image_grab is None:
+        try:
+            from PIL import ImageGrab
+            _image_grab = ImageGrab
+        except ImportError:
+            _image_grab = False
+            print("Pillow library not found. Screenshots will be disabled. (Run 'pip install Pillow' to enable)")
+    return _image_grab or None
 
-# Import the implemented algorithms
-from src.algorithms import bfs, dfs, ucs, ids, astar, greedy, hill_climbing
 
 # --- UI Colors ---
 COLOR_EMPTY = "white"
@@ -74,7 +84,10 @@ class PathFindingApp:
             "IDS (Iterative Deepening)": ids,
             "A* Search (Manhattan)": astar,
             "Greedy Best-First": greedy,
-            "Hill Climbing": hill_climbing
+            "Hill Climbing": hill_climbing,
+            "Beam Search": beam_search,
+            "Simulated Annealing": simulated_annealing,
+            "SMA* (Memory-Bounded)": sma_star
         }
         self.cb = ttk.Combobox(control_frame, textvariable=self.algo_var, values=list(self.algos.keys()),
                                state="readonly")
@@ -193,8 +206,8 @@ class PathFindingApp:
         Automatically saves experiment metrics to a CSV file and captures a screenshot of the maze.
         """
         # 1. Ensure the 'results' directory exists
-        base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-        results_dir = os.path.join(base_dir, 'results')
+        # (relative to the working directory, so it also works when installed as a package)
+        results_dir = os.path.join(os.getcwd(), 'results')
 
         if not os.path.exists(results_dir):
             os.makedirs(results_dir)
@@ -220,6 +233,7 @@ class PathFindingApp:
             print(f"[!] Error saving CSV: {e}")
 
         # 3. Capture and save a screenshot of the canvas (if Pillow is installed)
+        ImageGrab = load_image_grab()
         if ImageGrab:
             # Force the UI to update to ensure the drawing is complete
             self.root.update()
@@ -289,9 +303,7 @@ class PathFindingApp:
 
         # --- Auto-Save Data ---
         # Determine if the algorithm is theoretically optimal
-        optimal_algos = ["BFS (Breadth-First)", "A* Search (Manhattan)", "UCS (Uniform-Cost)",
-                         "IDS (Iterative Deepening)"]
-        is_optimal = "Yes" if algo_name in optimal_algos else "No"
+        is_optimal = "Yes" if algo_module.__name__.rsplit(".", 1)[-1] in OPTIMAL else "No"
 
         # Call the save method
         self.save_experiment_data(algo_name, exec_time, nodes_count, cost, is_optimal)
@@ -302,6 +314,8 @@ class PathFindingApp:
             messagebox.showinfo("Info", "Run at least two algorithms to compare!")
             return
 
+        import matplotlib.pyplot as plt  # Used for comparison charts
+
         names = list(self.comparison_data.keys())
         # Shorten names for the chart (e.g., "BFS (Breadth-First)" -> "BFS")
         short_names = [n.split()[0] for n in names]
@@ -325,8 +339,8 @@ class PathFindingApp:
         plt.tight_layout()
 
         # --- Save Chart to File ---
-        base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-        results_dir = os.path.join(base_dir, 'results')
+        # Saved under ./results, next to the experiment log
+        results_dir = os.path.join(os.getcwd(), 'results')
 
         if not os.path.exists(results_dir):
             os.makedirs(results_dir)
@@ -341,7 +355,12 @@ class PathFindingApp:
         plt.show()
 
 
-if __name__ == "__main__":
+def main():
+    """Entry point of the 'pathfinding-gui' command."""
     root = tk.Tk()
     app = PathFindingApp(root)
     root.mainloop()
+
+
+if __name__ == "__main__":
+    main()
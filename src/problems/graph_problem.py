@@ -0,0 +1,130 @@
+# src/problems/graph_problem.py
+
+from array import array
+
+from .problem import Problem
+
+
+class CSRGraph:
+    """
+    Weighted directed graph stored in Compressed Sparse Row (CSR) form.
+
+    The out-edges of node u are targets[offsets[u]:offsets[u + 1]] with the
+    matching weights. Three flat arrays keep memory at roughly 16 bytes per edge,
+    which is what makes graphs with millions of edges practical in pure Python.
+    """
+
+    def __init__(self, offsets, targets, weights):
+        self.offsets = offsets  # array('q'), length num_nodes + 1
+        self.targets = targets  # array('i'), length num_edges
+        self.weights = weights  # array('d'), length num_edges
+
+    @property
+    def num_nodes(self):
+        return len(self.offsets) - 1
+
+    @property
+    def num_edges(self):
+        return len(self.targets)
+
+    @classmethod
+    def from_edges(cls, num_nodes, sources, targets, weights=None, directed=True):
+        """
+        Builds a CSR graph from parallel sequences of edge endpoints.
+        If 'weights' is None every edge costs 1.
+        If 'directed' is False, the reverse of every edge is added as well.
+        """
+        if weights is None:
+            weights = array('d', [1.0]) * len(sources)
+        if not directed:
+            sources, targets = (array('i', sources) + array('i', targets),
+                                array('i', targets) + array('i', sources))
+            weights = array('d', weights) + array('d', weights)
+
+        # Pass 1: count the out-degree of every node
+        offsets = array('q', [0]) * (num_nodes + 1)
+        for u in sources:
+            offsets[u + 1] += 1
+
+        # Prefix sum turns degrees into start offsets
+        for u in range(num_nodes):
+            offsets[u + 1] += offsets[u]
+
+        # Pass 2: place every edge in its row (counting sort by source)
+        num_edges = offsets[num_nodes]
+        csr_targets = array('i', [0]) * num_edges
+        csr_weights = array('d', [0.0]) * num_edges
+        cursor = array('q', offsets[:-1])
+        for u, v, w in zip(sources, targets, weights):
+            i = cursor[u]
+            csr_targets[i] = v
+            csr_weights[i] = w
+            cursor[u] = i + 1
+
+        return cls(offsets, csr_targets, csr_weights)
+
+    def neighbors(self, u):
+        """Returns an iterable of (v, weight) pairs for the out-edges of u."""
+        lo, hi = self.offsets[u], self.offsets[u + 1]
+        return zip(self.targets[lo:hi], self.weights[lo:hi])
+
+
+def load_edge_list(path, directed=True):
+    """
+    Loads a CSR graph from a whitespace separated edge-list file.
+
+    Each line is 'u v' or 'u v weight' with non-negative integer node ids.
+    Blank lines and lines starting with '#' or '%' are ignored.
+    The number of nodes is the largest id + 1.
+    """
+    sources = array('i')
+    targets = array('i')
+    weights = array('d')
+    max_id = -1
+
+    with open(path) as f:
+        for line_no, line in enumerate(f, 1):
+            parts = line.split()
+            if not parts or parts[0][0] in '#%':
+                continue
+            if len(parts) not in (2, 3):
+                raise ValueError(f"{path}:{line_no}: expected 'u v [weight]', got {line.strip()!r}")
+
+            u, v = int(parts[0]), int(parts[1])
+            w = float(parts[2]) if len(parts) == 3 else 1.0
+            if u < 0 or v < 0:
+                raise ValueError(f"{path}:{line_no}: node ids must be non-negative")
+            if w < 0:
+                raise ValueError(f"{path}:{line_no}: edge weights must be non-negative")
+
+            sources.append(u)
+            targets.append(v)
+            weights.append(w)
+            if u > max_id: max_id = u
+            if v > max_id: max_id = v
+
+    return CSRGraph.from_edges(max_id + 1, sources, targets, weights, directed=directed)
+
+
+class GraphProblem(Problem):
+    """
+    Shortest-path problem on a CSRGraph. States are the graph's node ids.
+
+    'heuristic' is an optional function h(state, goal) -> float.
+    Without it h(n) = 0, so A* behaves like UCS (Dijkstra).
+    """
+
+    def __init__(self, graph, start, goal, heuristic=None):
+        self.graph = graph
+        self.num_states = graph.num_nodes
+        self.start = start
+        self.goal = goal
+        self._heuristic = heuristic
+
+    def successors(self, state):
+        return self.graph.neighbors(state)
+
+    def heuristic(self, state):
+        if self._heuristic is None:
+            return 0
+        return self._heuristic(state, self.goal)
@@ -1,5 +1,11 @@
 # src/problems/grid_problem.py
 
+from .problem import Problem
+
+# Directions: Down, Right, Up, Left
+DIRECTIONS = [(1, 0), (0, 1), (-1, 0), (0, -1)]
+
+
 class Node:
     """
     Represents a single cell (state) in the grid.
@@ -28,11 +34,9 @@ def get_neighbors(node, grid, rows, cols):
     Returns a list of valid adjacent coordinates (neighbors) for a given node.
     It checks grid boundaries and obstacles.
     """
-    # Directions: Down, Right, Up, Left
-    directions = [(1, 0), (0, 1), (-1, 0), (0, -1)]
     neighbors = []
 
-    for dr, dc in directions:
+    for dr, dc in DIRECTIONS:
         nr, nc = node.r + dr, node.c + dc
 
         # Check 1: Within Grid Boundaries
@@ -54,4 +58,58 @@ def reconstruct_path(node):
     while curr:
         path.append((curr.r, curr.c))
         curr = curr.parent  # Move back to the previous node
-    return path[::-1]  # Reverse list to show path from Start -> Goal
\ No newline at end of file
+    return path[::-1]  # Reverse list to show path from Start -> Goal
+
+
+class GridProblem(Problem):
+    """
+    The 2D grid pathfinding problem expressed through the generic Problem interface.
+    Cell (r, c) has the state id r * cols + c. Every move costs 1.
+    """
+
+    def __init__(self, start_pos, goal_pos, grid, rows, cols):
+        self.grid = grid
+        self.rows = rows
+        self.cols = cols
+        self.num_states = rows * cols
+
+        self.goal_pos = goal_pos
+        self.start = self.encode(start_pos)
+        self.goal = self.encode(goal_pos)
+
+    def encode(self, value):
+        return value[0] * self.cols + value[1]
+
+    def decode(self, state):
+        return divmod(state, self.cols)
+
+    def successors(self, state):
+        """Yields the free adjacent cells, in the same order as get_neighbors."""
+        r, c = divmod(state, self.cols)
+        for dr, dc in DIRECTIONS:
+            nr, nc = r + dr, c + dc
+            if 0 <= nr < self.rows and 0 <= nc < self.cols and self.grid[nr][nc] == 0:
+                yield nr * self.cols + nc, 1
+
+    def heuristic(self, state):
+        """Manhattan Distance. Admissible for 4-directional grid movement."""
+        r, c = divmod(state, self.cols)
+        return abs(r - self.goal_pos[0]) + abs(c - self.goal_pos[1])
+
+
+def grid_ui_callback(problem, update_ui):
+    """
+    Adapts a GUI callback that expects grid Nodes (with .r and .c)
+    so it can be passed to the generic solvers, which report SearchNodes.
+    """
+    if update_ui is None:
+        return None
+
+    def callback(node):
+        if node is None:
+            update_ui(None)
+        else:
+            r, c = problem.decode(node.state)
+            update_ui(Node(r, c))
+
+    return callback
@@ -0,0 +1,155 @@
+# src/problems/maps.py
+
+import random
+
+# Seeded benchmark maps.
+# Every generator returns (grid, start_pos, goal_pos) with 0 = Empty and 1 = Wall,
+# and the same arguments always give the same map.
+
+
+def open_map(rows, cols, seed=0):
+    """Empty grid, start and goal in opposite corners."""
+    grid = [[0] * cols for _ in range(rows)]
+    return grid, (0, 0), (rows - 1, cols - 1)
+
+
+def random_map(rows, cols, seed=0, density=0.25):
+    """Randomly scattered walls covering roughly 'density' of the cells."""
+    rng = random.Random(seed)
+    grid = [[1 if rng.random() < density else 0 for _ in range(cols)] for _ in range(rows)]
+    start, goal = (0, 0), (rows - 1, cols - 1)
+    grid[start[0]][start[1]] = 0
+    grid[goal[0]][goal[1]] = 0
+    return grid, start, goal
+
+
+def concave_map(rows, cols, seed=0):
+    """
+    A 'C' shaped wall that opens towards the start and blocks the straight line
+    to the goal. Greedy and Hill Climbing walk straight into the pocket.
+    """
+    grid = [[0] * cols for _ in range(rows)]
+    top, bottom = rows // 4, (3 * rows) // 4
+    left, right = cols // 3, (2 * cols) // 3
+
+    for r in range(top, bottom + 1):
+        grid[r][right] = 1
+    for c in range(left, right + 1):
+        grid[top][c] = 1
+        grid[bottom][c] = 1
+
+    return grid, (rows // 2, 0), (rows // 2, cols - 1)
+
+
+def maze_map(rows, cols, seed=0):
+    """
+    A perfect maze (exactly one path between any two cells) carved by a
+    randomized depth-first search. Passages run through the even cells.
+    """
+    rng = random.Random(seed)
+    grid = [[1] * cols for _ in range(rows)]
+    start = (0, 0)
+    grid[0][0] = 0
+
+    stack = [start]
+    while stack:
+        r, c = stack[-1]
+        options = [(r + dr, c + dc, r + dr // 2, c + dc // 2)
+                   for dr, dc in ((2, 0), (0, 2), (-2, 0), (0, -2))
+                   if 0 <= r + dr < rows and 0 <= c + dc < cols and grid[r + dr][c + dc] == 1]
+        if not options:
+            stack.pop()
+            continue
+        nr, nc, wr, wc = rng.choice(options)
+        grid[wr][wc] = 0  # Knock down the wall between the two cells
+        grid[nr][nc] = 0
+        stack.append((nr, nc))
+
+    goal = ((rows - 1) // 2 * 2, (cols - 1) // 2 * 2)
+    return grid, start, goal
+
+
+def rooms_map(rows, cols, seed=0, room_size=8):
+    """
+    Square rooms separated by walls, with one random door in every wall
+    segment between two rooms.
+    """
+    rng = random.Random(seed)
+    grid = [[0] * cols for _ in range(rows)]
+    wall_rows = list(range(room_size, rows - 1, room_size))
+    wall_cols = list(range(room_size, cols - 1, room_size))
+
+    for r in wall_rows:
+        for c in range(cols):
+            grid[r][c] = 1
+    for c in wall_cols:
+        for r in range(rows):
+            grid[r][c] = 1
+
+    # Open a door in each segment between two wall crossings
+    row_edges = [-1] + wall_rows + [rows]
+    col_edges = [-1] + wall_cols + [cols]
+    for r in wall_rows:
+        for lo, hi in zip(col_edges, col_edges[1:]):
+            grid[r][rng.randrange(lo + 1, hi)] = 0
+    for c in wall_cols:
+        for lo, hi in zip(row_edges, row_edges[1:]):
+            grid[rng.randrange(lo + 1, hi)][c] = 0
+
+    return grid, (0, 0), (rows - 1, cols - 1)
+
+
+def unreachable_map(rows, cols, seed=0):
+    """Empty grid except for a closed ring of walls around the goal in the middle."""
+    grid = [[0] * cols for _ in range(rows)]
+    goal = (rows // 2, cols // 2)
+    for dr in (-1, 0, 1):
+        for dc in (-1, 0, 1):
+            if (dr, dc) != (0, 0):
+                grid[goal[0] + dr][goal[1] + dc] = 1
+    return grid, (0, 0), goal
+
+
+def load_map(path):
+    """
+    Reads a grid from a text file, one row per line:
+        '.' or '0' = Empty, '#' or '1' = Wall, 'S' = Start, 'G' = Goal.
+    Returns (grid, start_pos, goal_pos); start/goal are None if not marked.
+    """
+    grid = []
+    start = goal = None
+
+    with open(path) as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            row = []
+            for c, ch in enumerate(line):
+                if ch in '.0':
+                    row.append(0)
+                elif ch in '#1':
+                    row.append(1)
+                elif ch in 'SG':
+                    row.append(0)
+                    if ch == 'S':
+                        start = (len(grid), c)
+                    else:
+                        goal = (len(grid), c)
+                else:
+                    raise ValueError(f"{path}:{len(grid) + 1}: unexpected character {ch!r}")
+            if grid and len(row) != len(grid[0]):
+                raise ValueError(f"{path}:{len(grid) + 1}: all rows must have the same length")
+            grid.append(row)
+
+    return grid, start, goal
+
+
+MAPS = {
+    "open": open_map,
+    "random": random_map,
+    "concave": concave_map,
+    "maze": maze_map,
+    "rooms": rooms_map,
+    "unreachable": unreachable_map,
+}
@@ -0,0 +1,86 @@
+# src/problems/problem.py
+
+class SearchNode:
+    """
+    Represents a single state in the search tree of an abstract Problem.
+    Stores the integer state id instead of grid coordinates.
+    """
+
+    __slots__ = ("state", "parent", "cost", "heuristic", "total_cost")
+
+    def __init__(self, state, parent=None, cost=0, heuristic=0):
+        self.state = state  # Integer state id (0 .. num_states - 1)
+        self.parent = parent  # The previous node (used to reconstruct the path)
+
+        self.cost = cost  # g(n): Cost from start to current node
+        self.heuristic = heuristic  # h(n): Estimated cost from current node to goal
+        self.total_cost = cost + heuristic  # f(n) = g(n) + h(n)
+
+    def __lt__(self, other):
+        """
+        Comparison method for Priority Queues (used in A*, UCS, Greedy).
+        Nodes with lower 'total_cost' are prioritized.
+        """
+        return self.total_cost < other.total_cost
+
+
+class Problem:
+    """
+    Base class for search problems the solvers can run against.
+
+    States are integer ids in the range [0, num_states), so solvers can keep
+    their bookkeeping in flat arrays instead of sets of tuples.
+    Subclasses must set 'num_states', 'start' and 'goal' and implement
+    'successors'. 'heuristic' defaults to 0 (always admissible).
+    """
+
+    num_states = 0
+    start = None
+    goal = None
+
+    def is_goal(self, state):
+        """Returns True if the given state id is the goal."""
+        return state == self.goal
+
+    def successors(self, state):
+        """
+        Returns an iterable of (next_state, step_cost) pairs
+        reachable from the given state id.
+        """
+        raise NotImplementedError
+
+    def heuristic(self, state):
+        """Estimated cost from the given state id to the goal."""
+        return 0
+
+    def encode(self, value):
+        """Converts an external state (e.g. grid coordinates) to a state id."""
+        return value
+
+    def decode(self, state):
+        """Converts a state id back to its external representation."""
+        return state
+
+    def path_cost(self, path):
+        """
+        Returns the total cost of a decoded path (as returned by the solvers),
+        using the cheapest edge between each pair of consecutive states.
+        """
+        states = [self.encode(p) for p in path]
+        total = 0
+        for u, v in zip(states, states[1:]):
+            total += min(cost for nxt, cost in self.successors(u) if nxt == v)
+        return total
+
+
+def reconstruct_states(node, problem):
+    """
+    Backtracks from the goal node to the start node using 'parent' pointers
+    and returns the path as a list of decoded states (Start -> Goal).
+    """
+    path = []
+    curr = node
+    while curr:
+        path.append(problem.decode(curr.state))
+        curr = curr.parent  # Move back to the previous node
+    return path[::-1]
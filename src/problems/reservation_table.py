@@ -0,0 +1,66 @@
+# src/problems/reservation_table.py
+
+class ReservationTable:
+    """
+    Space-time reservation table shared by agents planned one after another.
+
+    A reservation says "agent a occupies cell c at timestep t". It is stored in
+    a flat dict under the single integer key t * num_cells + c, which avoids
+    allocating a (cell, t) tuple per entry and keeps lookups to one hash.
+    Agents that have reached their goal are 'parked': they own the goal cell
+    from their arrival time onwards.
+    """
+
+    def __init__(self, num_cells):
+        self.num_cells = num_cells
+        self.slots = {}  # t * num_cells + cell -> agent id
+        self.parked = {}  # cell -> (arrival time, agent id)
+        self.last_time = {}  # cell -> latest timestep reserved in 'slots'
+        self.max_time = 0
+
+    def owner(self, cell, t):
+        """Returns the id of the agent occupying 'cell' at time t, or None."""
+        agent = self.slots.get(t * self.num_cells + cell)
+        if agent is None:
+            parked = self.parked.get(cell)
+            if parked is not None and t >= parked[0]:
+                return parked[1]
+        return agent
+
+    def is_free(self, cell, t, agent):
+        """True if 'agent' may occupy 'cell' at time t."""
+        owner = self.owner(cell, t)
+        return owner is None or owner == agent
+
+    def is_swap(self, cell, nxt, t, agent):
+        """
+        True if moving cell -> nxt between t and t + 1 would swap places
+        with another agent moving nxt -> cell (a head-on collision).
+        """
+        other = self.slots.get(t * self.num_cells + nxt)
+        return other is not None and other != agent and self.owner(cell, t + 1) == other
+
+    def can_rest(self, cell, t):
+        """True if no agent passes through 'cell' after time t, so an agent can stop there for good."""
+        return self.last_time.get(cell, -1) <= t and cell not in self.parked
+
+    def reserve(self, cells, start_time, agent, park=False):
+        """
+        Reserves 'cells' (one per timestep, starting at start_time) for 'agent'.
+        If 'park' is True the agent also keeps the last cell forever.
+        """
+        n = self.num_cells
+        for i, cell in enumerate(cells):
+            t = start_time + i
+            self.slots[t * n + cell] = agent
+            if t > self.last_time.get(cell, -1):
+                self.last_time[cell] = t
+
+        end_time = start_time + len(cells) - 1
+        if end_time > self.max_time:
+            self.max_time = end_time
+        if park:
+            self.parked[cells[-1]] = (end_time, agent)
+
+    def __len__(self):
+        return len(self.slots)
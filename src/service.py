@@ -0,0 +1,358 @@
+# src/service.py
+
+import argparse
+import asyncio
+import json
+import os
+import signal
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from .algorithms import ALGORITHMS, get_algorithm
+from .algorithms.local_search import Budget
+from .problems.grid_problem import GridProblem
+from .problems.maps import MAPS, load_map
+
+# Maps resident in each worker process, filled once by _init_worker
+_worker_maps = {}
+
+
+class SolveError(Exception):
+    """A query the worker could not answer: the solver failed or ran out of time."""
+
+
+class BudgetedGridProblem(GridProblem):
+    """
+    A GridProblem that raises TimeoutError once its budget is spent. Every solver
+    asks for successors at each expansion, so this bounds all of them, including
+    the ones that take no budget of their own (e.g. a single deep pass of IDS).
+    """
+
+    def __init__(self, start_pos, goal_pos, grid, rows, cols, budget):
+        super().__init__(start_pos, goal_pos, grid, rows, cols)
+        self.budget = budget
+
+    def successors(self, state):
+        if not self.budget.spend():
+            raise TimeoutError(f"time limit exceeded after {self.budget.steps - 1} expansions")
+        return super().successors(state)
+
+
+def _init_worker(maps):
+    """Worker initializer: receives the maps once instead of with every request."""
+    _worker_maps.update(maps)
+
+
+def solve_batch(map_name, goal, items, time_limit=None):
+    """
+    Runs in a worker process. Solves every (algorithm, start) in 'items'
+    towards the same goal on the same map and returns one result per item.
+    Each item gets 'time_limit' seconds. An item that fails or runs out of
+    time gets {"error": message} without affecting the rest of the batch.
+    """
+    grid, rows, cols = _worker_maps[map_name]
+    results = []
+    for algorithm, start in items:
+        t0 = time.perf_counter()
+        try:
+            problem = BudgetedGridProblem(start, goal, grid, rows, cols, Budget(time_limit=time_limit))
+            path, nodes = get_algorithm(algorithm).search(problem)
+        except Exception as e:
+            results.append({"error": f"{algorithm}: {type(e).__name__}: {e}"})
+            continue
+        results.append({
+            "path": [list(p) for p in path] if path is not None else None,
+            "cost": len(path) - 1 if path is not None else None,
+            "nodes_explored": nodes,
+            "time_ms": round((time.perf_counter() - t0) * 1000, 3),
+        })
+    return results
+
+
+def parse_map_spec(spec):
+    """
+    Parses a '--map NAME=SOURCE' argument. SOURCE is a map file, or a seeded
+    generated map written as KIND:SIZE[:SEED] (e.g. maze:64:1).
+    Returns (name, (grid, rows, cols)).
+    """
+    name, sep, source = spec.partition("=")
+    if not sep or not name:
+        raise ValueError(f"expected NAME=SOURCE, got {spec!r}")
+
+    kind, _, rest = source.partition(":")
+    if kind in MAPS and rest:
+        size, _, seed = rest.partition(":")
+        grid, _, _ = MAPS[kind](int(size), int(size), int(seed or 0))
+    else:
+        grid, _, _ = load_map(source)
+    return name, (grid, len(grid), len(grid[0]))
+
+
+class PathService:
+    """
+    Answers path queries on named maps that are loaded once and kept resident.
+
+    Solving is CPU-bound, so it runs in a process pool and the event loop only
+    routes requests. Two mechanisms reduce the work sent to the pool:
+      - coalescing: a request identical to one already in flight waits for
+        that result instead of being solved again;
+      - batching: requests for the same map and goal that arrive within
+        'batch_window' seconds are sent to a worker as one task.
+    Each query may run for 'time_limit' seconds (None = no limit) before it
+    fails with a SolveError; the other queries of its batch are unaffected.
+    """
+
+    def __init__(self, maps, workers=None, batch_window=0.002, time_limit=10.0):
+        self.maps = maps
+        self.batch_window = batch_window
+        self.time_limit = time_limit
+        self.executor = ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(maps,))
+
+        self._pending = {}  # (map, goal, algorithm, start) -> future shared by identical requests
+        self._batches = {}  # (map, goal) -> [(algorithm, start), ...] waiting to be sent
+        self._submitted = set()  # Pool futures not done yet, cancelled on close()
+        self.stats = {"requests": 0, "coalesced": 0, "batches": 0, "solved": 0}
+
+    def validate(self, request):
+        """Checks a query and returns (map, algorithm, start, goal). Raises ValueError."""
+        map_name = request.get("map")
+        if map_name not in self.maps:
+            raise ValueError(f"unknown map {map_name!r}")
+        algorithm = request.get("algorithm", "astar")
+        if algorithm not in ALGORITHMS:
+            raise ValueError(f"unknown algorithm {algorithm!r}, expected one of: {', '.join(ALGORITHMS)}")
+
+        grid, rows, cols = self.maps[map_name]
+        cells = []
+        for field in ("start", "goal"):
+            value = request.get(field)
+            if not (isinstance(value, list) and len(value) == 2 and all(isinstance(v, int) for v in value)):
+                raise ValueError(f"'{field}' must be [row, col]")
+            r, c = value
+            if not (0 <= r < rows and 0 <= c < cols) or grid[r][c] == 1:
+                raise ValueError(f"'{field}' {r},{c} is outside the map or on a wall")
+            cells.append((r, c))
+
+        return map_name, algorithm, cells[0], cells[1]
+
+    async def query(self, request):
+        """Solves one path query and returns its result dict."""
+        map_name, algorithm, start, goal = self.validate(request)
+        self.stats["requests"] += 1
+
+        key = (map_name, goal, algorithm, start)
+        future = self._pending.get(key)
+        if future is not None:
+            self.stats["coalesced"] += 1
+        else:
+            loop = asyncio.get_running_loop()
+            future = loop.create_future()
+            self._pending[key] = future
+
+            batch_key = (map_name, goal)
+            if batch_key not in self._batches:
+                self._batches[batch_key] = []
+                loop.call_later(self.batch_window, self._flush, batch_key)
+            self._batches[batch_key].append((algorithm, start))
+
+        # shield: a client that disconnects must not cancel a result others are waiting for
+        return await asyncio.shield(future)
+
+    def _flush(self, batch_key):
+        """Sends the collected batch for (map, goal) to the worker pool."""
+        items = self._batches.pop(batch_key)
+        map_name, goal = batch_key
+        self.stats["batches"] += 1
+        self.stats["solved"] += len(items)
+
+        submitted = self.executor.submit(solve_batch, map_name, goal, items, self.time_limit)
+        self._submitted.add(submitted)
+        submitted.add_done_callback(self._submitted.discard)
+        task = asyncio.wrap_future(submitted)
+        task.add_done_callback(lambda t: self._deliver(batch_key, items, t))
+
+    def _deliver(self, batch_key, items, task):
+        map_name, goal = batch_key
+        error = None if task.cancelled() else task.exception()
+        results = task.result() if not task.cancelled() and error is None else [None] * len(items)
+
+        for (algorithm, start), result in zip(items, results):
+            future = self._pending.pop((map_name, goal, algorithm, start))
+            if future.done():
+                continue
+            if task.cancelled():
+                future.cancel()
+            elif error is not None:
+                future.set_exception(error)
+            elif "error" in result:
+                future.set_exception(SolveError(result["error"]))
+            else:
+                future.set_result(result)
+
+    def describe_maps(self):
+        return {name: {"rows": rows, "cols": cols} for name, (grid, rows, cols) in self.maps.items()}
+
+    def close(self):
+        # Batches that have not started yet are dropped (shutdown's cancel_futures needs Python 3.9)
+        for submitted in list(self._submitted):
+            submitted.cancel()
+        self.executor.shutdown()
+
+    # --- Transport: HTTP/1.1 on localhost ---
+
+    async def handle_http(self, reader, writer):
+        """
+        Minimal HTTP/1.1 server with keep-alive.
+        POST /solve (JSON query), GET /maps, GET /stats.
+        """
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                method, path, _ = request_line.decode("latin-1").split(" ", 2)
+
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+                body = await reader.readexactly(int(headers.get("content-length", 0)))
+
+                status, payload = await self._route(method, path, body)
+                data = json.dumps(payload).encode()
+                keep_alive = headers.get("connection", "").lower() != "close"
+                writer.write(
+                    f"HTTP/1.1 {status}\r\nContent-Type: application/json\r\nContent-Length: {len(data)}\r\n"
+                    f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n".encode() + data)
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (ConnectionError, ValueError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    async def _route(self, method, path, body):
+        if method == "GET" and path == "/maps":
+            return "200 OK", self.describe_maps()
+        if method == "GET" and path == "/stats":
+            return "200 OK", self.stats
+        if method == "POST" and path == "/solve":
+            return await self._answer(body)
+        return "404 Not Found", {"error": f"no route for {method} {path}"}
+
+    async def _answer(self, raw):
+        try:
+            request = json.loads(raw)
+            if not isinstance(request, dict):
+                raise ValueError("request must be a JSON object")
+            return "200 OK", await self.query(request)
+        except ValueError as e:
+            return "400 Bad Request", {"error": str(e)}
+        except SolveError as e:
+            return "500 Internal Server Error", {"error": str(e)}
+        except Exception as e:
+            return "500 Internal Server Error", {"error": f"{type(e).__name__}: {e}"}
+
+    # --- Transport: newline-delimited JSON on a Unix socket ---
+
+    async def handle_unix(self, reader, writer):
+        """
+        One JSON query per line. Queries on a connection are answered concurrently,
+        so responses may come back out of order; an 'id' field is echoed back.
+        """
+        lock = asyncio.Lock()
+        tasks = set()
+
+        async def answer(line):
+            status, payload = await self._answer(line)
+            try:
+                # A copy: coalesced queries share one result dict
+                payload = {**payload, "id": json.loads(line).get("id")}
+            except (ValueError, AttributeError):
+                pass
+            async with lock:
+                writer.write(json.dumps(payload).encode() + b"\n")
+                await writer.drain()
+
+        try:
+            while line := await reader.readline():
+                task = asyncio.create_task(answer(line))
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+            await asyncio.gather(*tasks)
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+
+async def serve(service, host="127.0.0.1", port=8765, unix_path=None):
+    """Runs the HTTP server (and the Unix socket server if 'unix_path' is set) until cancelled."""
+    servers = []
+    if port is not None:
+        server = await asyncio.start_server(service.handle_http, host, port)
+        servers.append(server)
+        print(f"[-] Listening on http://{host}:{server.sockets[0].getsockname()[1]}", flush=True)
+    if unix_path is not None:
+        if os.path.exists(unix_path):
+            os.remove(unix_path)
+        servers.append(await asyncio.start_unix_server(service.handle_unix, unix_path))
+        print(f"[-] Listening on unix:{unix_path}", flush=True)
+
+    try:
+        await asyncio.gather(*(server.serve_forever() for server in servers))
+    finally:
+        for server in servers:
+            server.close()
+        if unix_path is not None and os.path.exists(unix_path):
+            os.remove(unix_path)
+
+
+def main(argv=None):
+    """Entry point of the 'pathfinding-service' command."""
+    parser = argparse.ArgumentParser(prog="pathfinding-service",
+                                     description="Local JSON path-query service (HTTP and/or Unix socket).")
+    parser.add_argument("--map", action="append", required=True, metavar="NAME=SOURCE",
+                        help="map to keep loaded: a map file or KIND:SIZE[:SEED] (repeatable)")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765, help="HTTP port (0 = pick a free port)")
+    parser.add_argument("--no-http", action="store_true", help="only serve the Unix socket")
+    parser.add_argument("--unix", metavar="PATH", help="also serve newline-delimited JSON on this Unix socket")
+    parser.add_argument("--workers", type=int, default=None, help="solver processes (default: CPU count)")
+    parser.add_argument("--batch-window", type=float, default=0.002, help="seconds to collect a batch")
+    parser.add_argument("--time-limit", type=float, default=10.0, help="seconds per query (0 = no limit)")
+    args = parser.parse_args(argv)
+
+    try:
+        maps = dict(parse_map_spec(spec) for spec in args.map)
+    except (ValueError, OSError) as e:
+        parser.error(str(e))
+    if args.no_http and not args.unix:
+        parser.error("--no-http needs --unix")
+
+    service = PathService(maps, workers=args.workers, batch_window=args.batch_window,
+                          time_limit=args.time_limit or None)
+
+    async def run():
+        task = asyncio.create_task(serve(service, args.host, None if args.no_http else args.port, args.unix))
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            loop.add_signal_handler(sig, task.cancel)
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+
+    try:
+        asyncio.run(run())
+    finally:
+        service.close()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -1,9 +1,4 @@
 import unittest
-import sys
-import os
-
-# Add the project root directory to the system path to allow importing modules
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from src.algorithms import bfs, dfs, ucs, astar, greedy
 from src.problems.grid_problem import Node
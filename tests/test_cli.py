@@ -0,0 +1,57 @@
+import unittest
+import io
+import os
+import subprocess
+import sys
+import tempfile
+from contextlib import redirect_stderr, redirect_stdout
+
+from src.cli import main
+from src.problems.maps import load_map
+
+
+class TestCLI(unittest.TestCase):
+
+    def setUp(self):
+        """A 3x4 map with a wall in the middle and marked start/goal cells."""
+        fd, self.path = tempfile.mkstemp(suffix=".txt")
+        with os.fdopen(fd, "w") as f:
+            f.write("S..#\n.#..\n...G\n")
+
+    def tearDown(self):
+        os.remove(self.path)
+
+    def test_load_map(self):
+        """Test that walls, start and goal are read from the map file."""
+        grid, start, goal = load_map(self.path)
+        self.assertEqual(grid, [[0, 0, 0, 1], [0, 1, 0, 0], [0, 0, 0, 0]])
+        self.assertEqual((start, goal), ((0, 0), (2, 3)))
+
+    def test_solve_map(self):
+        """Test that the command prints an optimal path for the chosen algorithm."""
+        out = io.StringIO()
+        with redirect_stdout(out):
+            code = main([self.path, "--algorithm", "bfs"])
+        self.assertEqual(code, 0)
+        self.assertIn("Path Cost: 5", out.getvalue())
+
+    def test_start_on_wall(self):
+        """Test that a start cell on a wall is rejected."""
+        err = io.StringIO()
+        with self.assertRaises(SystemExit), redirect_stderr(err):
+            main([self.path, "--start", "1,1"])
+        self.assertIn("on a wall", err.getvalue())
+
+    def test_library_import_is_gui_free(self):
+        """Test that importing the solvers does not load tkinter, matplotlib or Pillow."""
+        code = ("import sys; from src.algorithms import ALGORITHMS, get_algorithm\n"
+                "for name in ALGORITHMS: get_algorithm(name)\n"
+                "import src.cli\n"
+                "print([m for m in ('tkinter', 'matplotlib', 'PIL') if m in sys.modules])")
+        root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        result = subprocess.run([sys.executable, "-c", code], cwd=root, capture_output=True, text=True, check=True)
+        self.assertEqual(result.stdout.strip(), "[]")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,114 @@
+import unittest
+
+from src.algorithms import astar, cooperative_astar
+from src.problems.reservation_table import ReservationTable
+
+
+class TestCooperativeAStar(unittest.TestCase):
+
+    def setUp(self):
+        """
+        A 3x7 corridor with a single passing bay at (0, 4):
+            # # # # . # #
+            . . . . . . .
+            # # # # # # #
+        Two agents at opposite ends want to swap sides.
+        """
+        self.rows, self.cols = 3, 7
+        self.grid = [[1, 1, 1, 1, 0, 1, 1],
+                     [0, 0, 0, 0, 0, 0, 0],
+                     [1, 1, 1, 1, 1, 1, 1]]
+        self.agents = [((1, 0), (1, 6)), ((1, 6), (1, 0))]
+
+    def assertValidPaths(self, paths):
+        for path, (start, goal) in zip(paths, self.agents):
+            self.assertIsNotNone(path)
+            self.assertEqual((path[0], path[-1]), (start, goal))
+            for a, b in zip(path, path[1:]):
+                self.assertLessEqual(abs(a[0] - b[0]) + abs(a[1] - b[1]), 1, "agent jumped")
+        self.assertEqual(cooperative_astar.find_conflicts(paths), [])
+
+    def test_independent_paths_collide(self):
+        """Test that planning each agent alone produces a collision in the corridor."""
+        paths = [astar.solve(s, g, self.grid, self.rows, self.cols)[0] for s, g in self.agents]
+        self.assertNotEqual(cooperative_astar.find_conflicts(paths), [])
+
+    def test_hca_star_uses_passing_bay(self):
+        """Test that HCA* lets one agent step into the bay so the other can pass."""
+        paths, nodes = cooperative_astar.solve(self.agents, self.grid, self.rows, self.cols)
+        self.assertValidPaths(paths)
+        self.assertIn((0, 4), paths[0] + paths[1], "no agent used the passing bay")
+
+    def test_windowed(self):
+        """Test that WHCA* also produces collision-free paths to every goal."""
+        paths, nodes = cooperative_astar.solve(self.agents, self.grid, self.rows, self.cols, window=4)
+        self.assertValidPaths(paths)
+
+    def test_unreachable_goal(self):
+        """Test that an agent with an unreachable goal is reported as None."""
+        self.grid[1][5] = 1
+        paths, nodes = cooperative_astar.solve([((1, 0), (1, 6))], self.grid, self.rows, self.cols)
+        self.assertEqual(paths, [None])
+
+    def test_goal_cut_off_by_parked_agent(self):
+        """
+        Test that an agent whose goal is sealed off by an agent parked in the only door
+        fails quickly instead of searching every (cell, timestep) up to the horizon.
+        """
+        n = 32
+        grid = [[1 if c == n // 2 else 0 for c in range(n)] for _ in range(n)]
+        door = (n // 2, n // 2)
+        grid[door[0]][door[1]] = 0
+        agents = [((door[0], door[1] - 1), door), ((0, 0), (n - 1, n - 1))]
+
+        paths, nodes = cooperative_astar.solve(agents, grid, n, n)
+        self.assertIsNotNone(paths[0])
+        self.assertIsNone(paths[1])
+        self.assertLess(nodes, 1000)
+
+    def test_unplanned_agent_stays_on_start(self):
+        """
+        Test that the other agents route around an agent that cannot be planned,
+        even when they were planned before it and their shortest path crosses its start cell.
+            . . . . .
+            . . . . .      agent 0: (1, 0) -> (1, 4)
+            . . . . .      agent 1: (1, 2) -> (4, 0), which is walled off
+            # # # # #
+            . # . . .
+        """
+        grid = [[0] * 5 for _ in range(3)] + [[1] * 5, [0, 1, 0, 0, 0]]
+        agents = [((1, 0), (1, 4)), ((1, 2), (4, 0))]
+        starts = [start for start, _ in agents]
+
+        independent = [astar.solve(s, g, grid, 5, 5)[0] for s, g in agents[:1]] + [None]
+        self.assertNotEqual(cooperative_astar.find_conflicts(independent, starts), [])
+
+        paths, nodes = cooperative_astar.solve(agents, grid, 5, 5)
+        self.assertIsNone(paths[1])
+        self.assertEqual((paths[0][0], paths[0][-1]), agents[0])
+        self.assertNotIn((1, 2), paths[0])
+        self.assertEqual(cooperative_astar.find_conflicts(paths, starts), [])
+
+    def test_duplicate_goals_raise(self):
+        """Test that two agents may not share a goal cell."""
+        with self.assertRaises(ValueError):
+            cooperative_astar.solve([((1, 0), (1, 4)), ((1, 6), (1, 4))], self.grid, self.rows, self.cols)
+
+    def test_reservation_table(self):
+        """Test reservations, parking and swap detection."""
+        table = ReservationTable(num_cells=10)
+        table.reserve([1, 2, 3], 0, agent=0, park=True)
+
+        self.assertEqual(table.owner(2, 1), 0)
+        self.assertIsNone(table.owner(2, 2))
+        self.assertEqual(table.owner(3, 100), 0, "parked agent should keep its goal")
+        self.assertTrue(table.is_free(2, 1, agent=0))
+        self.assertFalse(table.is_free(2, 1, agent=1))
+        # Agent 1 moving 2 -> 1 between t=0 and t=1 would swap with agent 0 (1 -> 2)
+        self.assertTrue(table.is_swap(2, 1, 0, agent=1))
+        self.assertFalse(table.can_rest(2, 0))
+        self.assertTrue(table.can_rest(2, 1))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,88 @@
+import unittest
+import os
+import tempfile
+
+from src.algorithms import bfs, dfs, ucs, ids, astar, greedy
+from src.problems.graph_problem import CSRGraph, GraphProblem, load_edge_list
+
+
+class TestGraphProblem(unittest.TestCase):
+
+    def setUp(self):
+        """
+        Small weighted graph where the fewest-hops path (0 -> 3) is not the cheapest one.
+            0 -> 3 costs 10, 0 -> 1 -> 2 -> 3 costs 3. Node 4 is isolated.
+        """
+        self.edges = "# u v weight\n0 3 10\n0 1 1\n1 2 1\n2 3 1\n\n% isolated node\n4 4 0\n"
+        fd, self.path = tempfile.mkstemp(suffix=".txt")
+        with os.fdopen(fd, "w") as f:
+            f.write(self.edges)
+        self.graph = load_edge_list(self.path)
+
+    def tearDown(self):
+        os.remove(self.path)
+
+    def test_load_edge_list(self):
+        """Test that the loader builds the expected CSR rows."""
+        self.assertEqual(self.graph.num_nodes, 5)
+        self.assertEqual(self.graph.num_edges, 5)
+        self.assertEqual(sorted(self.graph.neighbors(0)), [(1, 1.0), (3, 10.0)])
+        self.assertEqual(list(self.graph.neighbors(3)), [])
+
+    def test_undirected_adds_reverse_edges(self):
+        """Test that an undirected graph stores both directions of each edge."""
+        graph = CSRGraph.from_edges(3, [0, 1], [1, 2], directed=False)
+        self.assertEqual(graph.num_edges, 4)
+        self.assertEqual(sorted(graph.neighbors(1)), [(0, 1.0), (2, 1.0)])
+
+    def test_bad_line_raises(self):
+        """Test that malformed lines are reported with their line number."""
+        with open(self.path, "w") as f:
+            f.write("0 1\n0\n")
+        with self.assertRaisesRegex(ValueError, ":2:"):
+            load_edge_list(self.path)
+
+    def test_weighted_optimality(self):
+        """Test that UCS and A* use edge costs while BFS minimises the number of steps."""
+        problem = GraphProblem(self.graph, 0, 3)
+        for module in (ucs, astar):
+            path, nodes = module.search(problem)
+            self.assertEqual(path, [0, 1, 2, 3], f"{module.__name__} path is not the cheapest")
+
+        path, nodes = bfs.search(problem)
+        self.assertEqual(path, [0, 3], "BFS path does not have the fewest steps")
+
+    def test_all_solvers_find_path(self):
+        """Test that every generic solver reaches the goal and reports None when it cannot."""
+        for module in (bfs, dfs, ucs, ids, astar, greedy):
+            path, nodes = module.search(GraphProblem(self.graph, 0, 3))
+            self.assertEqual((path[0], path[-1]), (0, 3), f"{module.__name__} failed to find a path")
+
+            path, nodes = module.search(GraphProblem(self.graph, 0, 4))
+            self.assertIsNone(path, f"{module.__name__} found a path to an unreachable node")
+
+    def test_grid_problem_matches_tuple_solvers(self):
+        """
+        Test that the grid solvers still return the paths and node counts of the
+        original tuple-based implementations (values recorded from those).
+        """
+        grid = [[0] * 5 for _ in range(5)]
+        grid[2][2] = grid[2][3] = grid[3][2] = 1
+        down_then_right = [(0, 0), (1, 0), (2, 0), (3, 0), (4, 0), (4, 1), (4, 2), (4, 3), (4, 4)]
+        around_the_wall = [(0, 0), (1, 0), (2, 0), (2, 1), (3, 1), (4, 1), (4, 2), (4, 3), (4, 4)]
+        snake = [(0, 0), (0, 1), (0, 2), (0, 3), (0, 4), (1, 4), (1, 3), (1, 2), (1, 1), (1, 0), (2, 0),
+                 (2, 1), (3, 1), (3, 0), (4, 0), (4, 1), (4, 2), (4, 3), (3, 3), (3, 4), (4, 4)]
+        expected = {
+            bfs: (down_then_right, 21),
+            dfs: (snake, 22),
+            ucs: (around_the_wall, 21),
+            astar: (around_the_wall, 19),
+            greedy: (down_then_right, 9),
+            ids: (down_then_right, 437),
+        }
+        for module, (path, nodes) in expected.items():
+            self.assertEqual(module.solve((0, 0), (4, 4), grid, 5, 5), (path, nodes), module.__name__)
+
+
+if __name__ == '__main__':
+    unittest.main()
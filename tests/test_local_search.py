@@ -0,0 +1,87 @@
+import unittest
+
+from src.algorithms import hill_climbing, simulated_annealing, beam_search
+from src.algorithms.local_search import Walk, parallel_restarts
+from src.problems.grid_problem import GridProblem
+from src.problems.maps import random_map, concave_map
+
+
+class TestLocalSearch(unittest.TestCase):
+
+    def setUp(self):
+        """
+        A seeded 30x30 random map on which plain Hill Climbing hits a dead end,
+        and a 'C' shaped trap between start and goal.
+        """
+        grid, start, goal = random_map(30, 30, seed=0)
+        self.trap = GridProblem(start, goal, grid, 30, 30)
+
+        grid, start, goal = concave_map(30, 30)
+        self.concave = GridProblem(start, goal, grid, 30, 30)
+
+    def assertValidPath(self, problem, path):
+        self.assertIsNotNone(path)
+        self.assertEqual(problem.encode(path[0]), problem.start)
+        self.assertEqual(problem.encode(path[-1]), problem.goal)
+        self.assertEqual(len(set(path)), len(path), "path revisits a cell")
+        # path_cost raises if two consecutive cells are not adjacent
+        self.assertEqual(problem.path_cost(path), len(path) - 1)
+
+    def test_walk_erases_loops(self):
+        """Test that revisiting a state cuts the walk back to its first visit."""
+        walk = Walk(0)
+        for s in (1, 2, 3, 1, 4):
+            walk.move(s)
+        self.assertEqual(walk.states, [0, 1, 4])
+
+    def test_hill_climbing_restarts(self):
+        """Test that random restarts recover from the dead end plain Hill Climbing gets stuck in."""
+        path, nodes = hill_climbing.search(self.trap)
+        self.assertIsNone(path, "plain Hill Climbing was expected to get stuck on this map")
+
+        path, nodes = hill_climbing.search(self.trap, restarts=50, seed=1)
+        self.assertValidPath(self.trap, path)
+
+    def test_solve_restarts_by_default(self):
+        """Test that the GUI entry point restarts instead of stopping at the first dead end."""
+        grid, start, goal = random_map(30, 30, seed=0)
+        path, nodes = hill_climbing.solve(start, goal, grid, 30, 30)
+        self.assertValidPath(self.trap, path)
+        self.assertLessEqual(nodes, 20 * 30 * 30)
+
+        path, nodes = hill_climbing.solve(start, goal, grid, 30, 30, restarts=0)
+        self.assertIsNone(path)
+
+    def test_sideways_limit(self):
+        """Test that a zero sideways budget stops at the first local optimum."""
+        path, nodes = hill_climbing.search(self.concave, sideways=0)
+        self.assertIsNone(path)
+
+    def test_budget(self):
+        """Test that max_steps bounds the total work."""
+        path, nodes = simulated_annealing.search(self.concave, seed=0, max_steps=5)
+        self.assertIsNone(path)
+        self.assertEqual(nodes, 5)
+
+    def test_simulated_annealing_and_beam(self):
+        """Test that annealing and beam search escape the concave trap."""
+        for problem in (self.trap, self.concave):
+            path, nodes = simulated_annealing.search(problem, seed=0, max_steps=20000)
+            self.assertValidPath(problem, path)
+
+            path, nodes = beam_search.search(problem, beam_width=10)
+            self.assertValidPath(problem, path)
+
+    def test_parallel_restarts(self):
+        """Test that parallel attempts return a valid path in both modes."""
+        for mode in ("first", "best"):
+            path, nodes = parallel_restarts(simulated_annealing.search, self.concave, attempts=4, workers=2,
+                                            mode=mode)
+            self.assertValidPath(self.concave, path)
+
+        with self.assertRaises(ValueError):
+            parallel_restarts(simulated_annealing.search, self.concave, mode="fastest")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,42 @@
+import unittest
+
+from benchmarks import perf_suite
+from src.algorithms import OPTIMAL
+from src.problems.maps import MAPS
+
+
+class TestPerformance(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        """
+        Run the whole benchmark suite once (a few seconds) and load the committed baseline.
+        Set PERF_TIME_TOLERANCE to loosen the time check on slow or busy machines.
+        """
+        cls.results = perf_suite.run_suite()
+        cls.baseline = perf_suite.load_baseline()
+
+    def test_no_regressions(self):
+        """Test that no case got slower, expanded more nodes, used more memory or found a worse path."""
+        regressions = perf_suite.compare(self.baseline, self.results)
+        self.assertEqual(regressions, [], "performance regressions:\n" + "\n".join(regressions))
+
+    def test_optimal_solvers(self):
+        """Test that every solver registered as optimal finds a shortest path on every map."""
+        for name, kind, size in perf_suite.cases():
+            if name not in OPTIMAL:
+                continue
+            grid, start, goal = MAPS[kind](size, size, perf_suite.SEED)
+            expected = perf_suite.reference_cost(grid, start, goal)
+            cost = self.results[perf_suite.case_key(name, kind, size)]["cost"]
+            self.assertEqual(cost, expected, f"{name} is not optimal on {kind} {size}x{size}")
+
+    def test_unreachable(self):
+        """Test that no solver reports a path to an enclosed goal."""
+        for key, metrics in self.results.items():
+            if "/unreachable/" in key:
+                self.assertIsNone(metrics["cost"], f"{key} found a path through walls")
+
+
+if __name__ == '__main__':
+    unittest.main()
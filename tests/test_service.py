@@ -0,0 +1,140 @@
+import unittest
+import asyncio
+import json
+import os
+import tempfile
+
+from src.problems.maps import open_map, maze_map
+from src.service import PathService, SolveError, _init_worker, parse_map_spec, solve_batch
+
+
+class TestService(unittest.IsolatedAsyncioTestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        """One service with a single worker process, shared by all tests."""
+        grid, _, _ = open_map(8, 8)
+        wide, _, _ = open_map(16, 16)  # Large enough that IDS cannot finish
+        cls.maps = {"open": (grid, 8, 8), "wide": (wide, 16, 16)}
+        cls.service = PathService(cls.maps, workers=1, batch_window=0.01, time_limit=0.5)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.service.close()
+
+    def setUp(self):
+        for key in self.service.stats:
+            self.service.stats[key] = 0
+
+    def query(self, start, goal=(7, 7), algorithm="astar"):
+        return {"map": "open", "algorithm": algorithm, "start": list(start), "goal": list(goal)}
+
+    async def test_query(self):
+        """Test that a query returns an optimal path computed in the worker."""
+        result = await self.service.query(self.query((0, 0), algorithm="bfs"))
+        self.assertEqual(result["cost"], 14)
+        self.assertEqual((result["path"][0], result["path"][-1]), ([0, 0], [7, 7]))
+
+    async def test_identical_requests_are_coalesced(self):
+        """Test that concurrent identical requests are solved only once."""
+        results = await asyncio.gather(*(self.service.query(self.query((0, 0))) for _ in range(5)))
+        self.assertTrue(all(r == results[0] for r in results))
+        self.assertEqual(self.service.stats["solved"], 1)
+        self.assertEqual(self.service.stats["coalesced"], 4)
+
+    async def test_same_goal_is_batched(self):
+        """Test that concurrent requests for one map and goal go to the pool as one batch."""
+        results = await asyncio.gather(*(self.service.query(self.query((0, c))) for c in range(4)))
+        self.assertEqual([r["cost"] for r in results], [14, 13, 12, 11])
+        self.assertEqual(self.service.stats["batches"], 1)
+
+    async def test_mixed_batch(self):
+        """Test that a query running out of time fails alone, not the rest of its batch."""
+        def query(algorithm, start):
+            return {"map": "wide", "algorithm": algorithm, "start": start, "goal": [15, 15]}
+
+        results = await asyncio.gather(self.service.query(query("ids", [0, 0])),
+                                       self.service.query(query("astar", [0, 1])), return_exceptions=True)
+        self.assertEqual(self.service.stats["batches"], 1)
+        self.assertIsInstance(results[0], SolveError)
+        self.assertIn("time limit", str(results[0]))
+        self.assertEqual(results[1]["cost"], 29)
+
+    def test_solver_error_is_per_item(self):
+        """Test that an exception in one solver is reported for that item only."""
+        _init_worker(self.maps)
+        results = solve_batch("open", (7, 7), [("astar", (0, 0)), ("teleport", (0, 0)), ("bfs", (0, 1))])
+        self.assertEqual([r.get("cost") for r in results], [14, None, 13])
+        self.assertIn("teleport", results[1]["error"])
+
+    async def test_invalid_requests(self):
+        """Test that unknown maps, algorithms and blocked cells are rejected."""
+        for request in ({"map": "nope"},
+                        self.query((0, 0), algorithm="teleport"),
+                        self.query((0, 0), goal=(8, 8)),
+                        {"map": "open", "start": "0,0", "goal": [1, 1]}):
+            with self.assertRaises(ValueError):
+                await self.service.query(request)
+
+    async def test_http(self):
+        """Test a POST /solve and a bad request over a real HTTP connection."""
+        server = await asyncio.start_server(self.service.handle_http, "127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+
+        async def post(payload):
+            body = json.dumps(payload).encode()
+            writer.write(b"POST /solve HTTP/1.1\r\nContent-Length: %d\r\n\r\n" % len(body) + body)
+            status = (await reader.readline()).split()[1]
+            headers = {}
+            while (line := await reader.readline()) != b"\r\n":
+                name, _, value = line.decode().partition(":")
+                headers[name.lower()] = value.strip()
+            return int(status), json.loads(await reader.readexactly(int(headers["content-length"])))
+
+        status, result = await post(self.query((0, 0)))
+        self.assertEqual((status, result["cost"]), (200, 14))
+
+        # Same keep-alive connection
+        status, result = await post({"map": "nope"})
+        self.assertEqual(status, 400)
+        self.assertIn("unknown map", result["error"])
+
+        writer.close()
+        server.close()
+        await server.wait_closed()
+
+    async def test_unix_socket_ids(self):
+        """Test that coalesced queries on one Unix socket connection each get their own id back."""
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "service.sock")
+            server = await asyncio.start_unix_server(self.service.handle_unix, path)
+            reader, writer = await asyncio.open_unix_connection(path)
+
+            query = self.query((0, 0))
+            writer.write(b"".join(json.dumps({**query, "id": i}).encode() + b"\n" for i in (1, 2)))
+
+            async def read_responses():
+                return [json.loads(await reader.readline()) for _ in range(2)]
+
+            # Another caller of the same query shares its result dict with the socket queries
+            shared, responses = await asyncio.gather(self.service.query(query), read_responses())
+            self.assertEqual(self.service.stats["coalesced"], 2)
+            self.assertEqual(sorted(r["id"] for r in responses), [1, 2])
+            self.assertNotIn("id", shared)
+
+            writer.close()
+            server.close()
+            await server.wait_closed()
+
+    def test_parse_map_spec(self):
+        """Test that generated map specs build the same seeded map."""
+        name, (grid, rows, cols) = parse_map_spec("m=maze:9:3")
+        self.assertEqual((name, rows, cols), ("m", 9, 9))
+        self.assertEqual(grid, maze_map(9, 9, 3)[0])
+        with self.assertRaises(ValueError):
+            parse_map_spec("maze:9")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,151 @@
+import unittest
+
+from src.algorithms import astar, sma_star
+from src.problems.graph_problem import CSRGraph, GraphProblem
+from src.problems.grid_problem import GridProblem
+from src.problems.maps import concave_map, maze_map, random_map, unreachable_map
+
+
+class TestSMAStar(unittest.TestCase):
+
+    def setUp(self):
+        """
+        A 'C' shaped trap on which A* expands many more nodes than the path is long,
+        and a maze whose solution path is long.
+        """
+        grid, start, goal = concave_map(24, 24)
+        self.concave = GridProblem(start, goal, grid, 24, 24)
+
+        grid, start, goal = maze_map(32, 32, seed=7)
+        self.maze = GridProblem(start, goal, grid, 32, 32)
+
+    def assertOptimal(self, problem, path):
+        expected, _ = astar.search(problem)
+        self.assertIsNotNone(path)
+        self.assertEqual(problem.encode(path[0]), problem.start)
+        self.assertEqual(problem.encode(path[-1]), problem.goal)
+        self.assertEqual(problem.path_cost(path), problem.path_cost(expected))
+
+    def test_without_memory_pressure(self):
+        """Test that with a large cap nothing is dropped and the path is optimal."""
+        stats = {}
+        path, nodes = sma_star.search(self.concave, stats=stats)
+        self.assertOptimal(self.concave, path)
+        self.assertEqual(stats["pruned"], 0)
+        self.assertEqual(stats["regenerated"], 0)
+
+    def test_tight_cap_still_optimal(self):
+        """Test that a cap far below A*'s node count still finds a shortest path, at the cost of regeneration."""
+        _, astar_nodes = astar.search(self.concave)
+        for problem in (self.concave, self.maze):
+            path, _ = astar.search(problem)
+            cap = len(path) + 2
+            self.assertLess(cap, astar_nodes)
+
+            stats = {}
+            path, nodes = sma_star.search(problem, max_nodes=cap, stats=stats)
+            self.assertOptimal(problem, path)
+            self.assertLessEqual(stats["peak_nodes"], cap)
+            self.assertGreater(stats["pruned"], 0)
+            self.assertGreater(stats["regenerated"], 0)
+            self.assertEqual(nodes, stats["expansions"])
+
+    def test_bounded_records(self):
+        """
+        Test that max_records bounds the dropped-node records without losing optimality when
+        it leaves room for the children of every stored node (4 per cell on a grid).
+        """
+        grid, start, goal = random_map(14, 14, seed=35, density=0.3)
+        cluttered = GridProblem(start, goal, grid, 14, 14)
+        for problem in (self.concave, cluttered):
+            path, _ = astar.search(problem)
+            cap = len(path) + 2
+            stats = {}
+            path, _ = sma_star.search(problem, max_nodes=cap, max_records=4 * cap, stats=stats)
+            self.assertOptimal(problem, path)
+            self.assertGreater(stats["peak_records"], 0)
+            self.assertLessEqual(stats["peak_records"], 4 * cap)
+
+    def test_too_few_records(self):
+        """Test that with too few records to finish, the step budget still ends the search."""
+        path, _ = astar.search(self.concave)
+        cap = len(path)
+        stats = {}
+        sma_star.search(self.concave, max_nodes=cap, max_records=cap, stats=stats, max_steps=20000)
+        self.assertLessEqual(stats["expansions"], 20000)
+        self.assertLessEqual(stats["peak_records"], cap)
+
+    def test_sibling_dropped_during_expansion(self):
+        """
+        Test a cap at which a child is dropped while its parent is still being expanded:
+        the dropped child's f must not be inherited by its siblings.
+        """
+        grid, start, goal = random_map(13, 13, seed=17, density=0.3)
+        problem = GridProblem(start, goal, grid, 13, 13)
+        path, _ = sma_star.search(problem, max_nodes=34)
+        self.assertOptimal(problem, path)
+
+    def test_path_longer_than_cap(self):
+        """Test that no path is returned when the solution cannot fit in memory."""
+        path, _ = astar.search(self.maze)
+        stats = {}
+        result, _ = sma_star.search(self.maze, max_nodes=len(path) - 1, stats=stats)
+        self.assertIsNone(result)
+        self.assertLessEqual(stats["peak_nodes"], len(path) - 1)
+
+    def test_unreachable(self):
+        """Test that an enclosed goal is reported as unreachable, with and without memory pressure."""
+        grid, start, goal = unreachable_map(16, 16)
+        problem = GridProblem(start, goal, grid, 16, 16)
+        for cap in (10000, 100):
+            path, _ = sma_star.search(problem, max_nodes=cap)
+            self.assertIsNone(path)
+
+    def test_weighted_graph(self):
+        """Test that the cheapest path is found on a weighted graph where it is not the fewest-hops one."""
+        graph = CSRGraph.from_edges(5, [0, 0, 1, 2, 0, 4], [3, 1, 2, 3, 4, 3], [10, 1, 1, 1, 2, 9])
+        problem = GraphProblem(graph, 0, 3)
+        for cap in (10000, 4):
+            path, _ = sma_star.search(problem, max_nodes=cap)
+            self.assertEqual(path, [0, 1, 2, 3])
+
+    def test_parallel_edges(self):
+        """Test that the cheapest of several edges between the same two nodes is used."""
+        graph = CSRGraph.from_edges(4, [0, 0, 0, 0, 2], [3, 3, 3, 2, 3], [5, 10, 2, 2, 1])
+        problem = GraphProblem(graph, 0, 3)
+        for cap in (10000, 3):
+            path, _ = sma_star.search(problem, max_nodes=cap)
+            self.assertEqual(path, [0, 3])
+
+    def test_goal_ties_dead_end(self):
+        """
+        Test caps at which the goal and a dead end tie on f: the goal must not be dropped
+        for the dead end, and a regenerated dead end must keep its backed-up f.
+        """
+        for sources, targets in (([0, 0], [2, 1]), ([0, 0], [1, 2])):
+            problem = GraphProblem(CSRGraph.from_edges(3, sources, targets, [3, 3]), 0, 2)
+            path, _ = sma_star.search(problem, max_nodes=2, max_steps=1000)
+            self.assertEqual(path, [0, 2])
+
+        graph = CSRGraph.from_edges(5, [2, 0, 1, 2, 0], [4, 2, 1, 3, 1], [3, 3, 1, 2, 2])
+        path, _ = sma_star.search(GraphProblem(graph, 0, 4), max_nodes=3, max_steps=1000)
+        self.assertEqual(path, [0, 2, 4])
+
+    def test_zero_weight_edges(self):
+        """Test that among equally cheap paths to a node, the one with fewer nodes is kept."""
+        graph = CSRGraph.from_edges(7, [2, 5, 3, 3, 0, 6, 2, 6], [4, 4, 2, 1, 1, 0, 1, 5],
+                                    [0, 1, 1, 2, 2, 0, 0, 1], directed=False)
+        problem = GraphProblem(graph, 0, 3)
+        for cap in (10000, 4):
+            path, _ = sma_star.search(problem, max_nodes=cap, max_steps=1000)
+            self.assertEqual(path, [0, 1, 2, 3])
+
+    def test_invalid_cap(self):
+        with self.assertRaises(ValueError):
+            sma_star.search(self.maze, max_nodes=1)
+        with self.assertRaises(ValueError):
+            sma_star.search(self.maze, max_nodes=100, max_records=99)
+
+
+if __name__ == '__main__':
+    unittest.main()